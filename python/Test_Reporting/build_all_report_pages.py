@@ -33,6 +33,7 @@ import json
 import logging
 import os
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from typing import List, TYPE_CHECKING
 
@@ -48,6 +49,9 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+# The maximum number of build callables to run in parallel
+MAX_BUILD_THREADS = 8
+
 
 @log_entry_exit(logger)
 def get_build_argument_parser():
@@ -145,12 +149,35 @@ def run_build_all_from_args(args):
 
     d_manifest = read_manifest(os.path.join(args.rootdir, args.manifest))
 
-    l_test_meta: List[ValTestMeta] = []
-
-    # Call the build function for each file in the manifest
-    for key, value in d_manifest.items():
-        build_callable = determine_build_callable(key, value)
-        l_test_meta += build_callable(value, args.rootdir, None, None, OutputFormat.HTML)
+    # Determine the build callable for each file in the manifest, and group the files by which build callable they use
+    l_build_callables_and_values = [(determine_build_callable(key, value), value) for key, value in d_manifest.items()]
+
+    d_l_indices_by_build_callable: Dict[int, List[int]] = {}
+    for i, (build_callable, _) in enumerate(l_build_callables_and_values):
+        d_l_indices_by_build_callable.setdefault(id(build_callable), []).append(i)
+
+    l_l_test_meta: List[List[ValTestMeta]] = [[] for _ in l_build_callables_and_values]
+
+    def build_group(l_indices):
+        for index in l_indices:
+            build_callable, value = l_build_callables_and_values[index]
+            l_l_test_meta[index] = build_callable(value, args.rootdir, None, None, OutputFormat.HTML)
+
+    # Call the build function for each file in the manifest. Each build is largely I/O-bound, so different build
+    # callables are run in parallel with a pool of threads. Files which use the same build callable are built in turn
+    # though, as a build callable may keep state while it's running
+    l_l_indices = list(d_l_indices_by_build_callable.values())
+    if len(l_l_indices) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_BUILD_THREADS, len(l_l_indices))) as executor:
+            # Consume the iterator so that any exceptions raised in the threads are raised here
+            list(executor.map(build_group, l_l_indices))
+    else:
+        for l_indices in l_l_indices:
+            build_group(l_indices)
+
+    # Combine the output in the order of the manifest, so that it doesn't depend on the order builds finished in
+    l_test_meta: List[ValTestMeta] = [test_meta for l_test_meta_for_file in l_l_test_meta
+                                      for test_meta in l_test_meta_for_file]
 
     # Build the summary page for test reports
     build_test_report_summary(test_report_summary_filename=TEST_REPORT_SUMMARY_FILENAME,
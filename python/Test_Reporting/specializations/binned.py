@@ -80,8 +80,7 @@ class BinnedReportSummaryWriter(ReportSummaryWriter):
 
         # If we have any error messages, print them out
         if l_err_str:
-            for line in l_err_str:
-                writer.add_line(f"**Error reported:** {line}\n\n")
+            writer.add_lines(f"**Error reported:** {line}\n\n" for line in l_err_str)
 
         self._add_binned_details(writer=writer,
                                  test_case_results=test_case_results,
@@ -102,9 +101,8 @@ class BinnedReportSummaryWriter(ReportSummaryWriter):
         the lack of data.
         """
         writer.add_line("No data available for this test. Reported reason(s):\n\n")
-        for si in test_case_results.l_requirements[0].l_supp_info:
-            if si.info_key == REASON_KEY:
-                writer.add_line(f"* {si.info_value.strip()}\n\n")
+        writer.add_lines(f"* {si.info_value.strip()}\n\n" for si in test_case_results.l_requirements[0].l_supp_info
+                         if si.info_key == REASON_KEY)
 
     def _add_binned_details(self,
                             writer: TocMarkdownWriter,
@@ -224,8 +222,7 @@ class BinnedReportSummaryWriter(ReportSummaryWriter):
         except Exception as e:
             logger.error("%s", e)
             writer.add_line("```\n")
-            for line in l_info_lines:
-                writer.add_line(f"{line.strip()}\n")
+            writer.add_lines(f"{line.strip()}\n" for line in l_info_lines)
             writer.add_line("```\n")
 
     @staticmethod
@@ -235,8 +232,7 @@ class BinnedReportSummaryWriter(ReportSummaryWriter):
         child classes.
         """
         writer.add_line("```\n")
-        for line in l_info_lines:
-            writer.add_line(f"{line.strip()}\n")
+        writer.add_lines(f"{line.strip()}\n" for line in l_info_lines)
         writer.add_line("```\n")
 
     @staticmethod
@@ -93,8 +93,7 @@ class CtiGalReportSummaryWriter(BinnedReportSummaryWriter):
             except Exception as e:
                 logger.error("%s", e)
                 writer.add_line("```\n")
-                for line in l_info_lines:
-                    writer.add_line(f"{line.strip()}\n")
+                writer.add_lines(f"{line.strip()}\n" for line in l_info_lines)
                 writer.add_line("```\n")
 
     @staticmethod
@@ -113,9 +112,8 @@ class CtiGalReportSummaryWriter(BinnedReportSummaryWriter):
         max_val_z = l_info_lines[3].split(VAL_SEPARATOR)[1]
         val_result = l_info_lines[4].split(RESULT_SEPARATOR)[1]
 
-        writer.add_line(msg_val % (val, val_err))
-        writer.add_line(msg_z % (val_z, max_val_z))
-        writer.add_line(msg_result % val_result)
+        # Format all the info first and add it in one go, so nothing is added if there's an error in formatting
+        writer.add_line(f"{msg_val % (val, val_err)}{msg_z % (val_z, max_val_z)}{msg_result % val_result}")
 
     @staticmethod
     @log_entry_exit(logger)
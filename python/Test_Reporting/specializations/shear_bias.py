@@ -31,6 +31,7 @@ from Test_Reporting.specializations.binned import (BinnedReportSummaryWriter, MS
                                                    VAL_SEPARATOR, )
 from Test_Reporting.utility.misc import TocMarkdownWriter, log_entry_exit
 from Test_Reporting.utility.product_parsing import SingleTestResult, TestResults
+from Test_Reporting.utility.report_writing import get_unique_test_case_names
 
 logger = getLogger(__name__)
 
@@ -67,8 +68,7 @@ class ShearBiasReportSummaryWriter(BinnedReportSummaryWriter):
         names of reports are generated to include the parameter used for binning.
         """
 
-        d_test_name_instances: Dict[str, int] = {}
-        l_test_case_names: List[str] = []
+        l_test_case_root_names: List[str] = []
 
         for test_case_results in test_results.l_test_results:
 
@@ -84,20 +84,13 @@ class ShearBiasReportSummaryWriter(BinnedReportSummaryWriter):
                 # bin parameters
                 test_case_root_name = f"{test_case_id}-BG"
             else:
-                logger.error("Could not determine binning parameter from test description: "
-                             f"\"{test_case_results.test_description}\"")
+                logger.error("Could not determine binning parameter from test description: \"%s\"",
+                             test_case_results.test_description)
                 test_case_root_name = test_case_id
 
-            if test_case_root_name in d_test_name_instances:
-                d_test_name_instances[test_case_root_name] += 1
-                test_case_name = f"{test_case_root_name}-{d_test_name_instances[test_case_root_name]}{test_name_tail}"
-            else:
-                d_test_name_instances[test_case_root_name] = 1
-                test_case_name = f"{test_case_root_name}{test_name_tail}"
-
-            l_test_case_names.append(test_case_name)
+            l_test_case_root_names.append(test_case_root_name)
 
-        return l_test_case_names
+        return list(get_unique_test_case_names(tuple(l_test_case_root_names), test_name_tail))
 
     @log_entry_exit(logger)
     def _write_bin_figures_and_info(self,
@@ -150,8 +143,7 @@ class ShearBiasReportSummaryWriter(BinnedReportSummaryWriter):
             except Exception as e:
                 logger.error("%s", e)
                 writer.add_line("```\n")
-                for line in l_info_lines:
-                    writer.add_line(f"{line.strip()}\n")
+                writer.add_lines(f"{line.strip()}\n" for line in l_info_lines)
                 writer.add_line("```\n")
 
     @staticmethod
@@ -170,13 +162,11 @@ class ShearBiasReportSummaryWriter(BinnedReportSummaryWriter):
         val_result = l_info_lines[4].split(RESULT_SEPARATOR)[1]
 
         msg_val = MSG_B_VAL.replace(STR_REPLACE_BIAS, bias).replace(STR_REPLACE_COMP, str(comp_index))
-        writer.add_line(msg_val % (val, val_err))
-
         msg_z = MSG_B_Z.replace(STR_REPLACE_BIAS, bias).replace(STR_REPLACE_COMP, str(comp_index))
-        writer.add_line(msg_z % (val_z, max_val_z))
-
         msg_result = MSG_B_RESULT.replace(STR_REPLACE_BIAS, bias).replace(STR_REPLACE_COMP, str(comp_index))
-        writer.add_line(msg_result % val_result)
+
+        # Format all the info first and add it in one go, so nothing is added if there's an error in formatting
+        writer.add_line(f"{msg_val % (val, val_err)}{msg_z % (val_z, max_val_z)}{msg_result % val_result}")
 
     @staticmethod
     @log_entry_exit(logger)
@@ -41,6 +41,9 @@ TEST_DATA_DIR = "test_data"
 TEST_REPORT_SUMMARY_FILENAME = "Test_Reports.md"
 TEST_REPORTS_SUBDIR = "TR"
 
+# Buffer size to use when writing out report files, which are each written with a single call to `write`
+WRITE_BUFFER_SIZE = 1 << 20
+
 # Heading for a Table of Contents
 HEADING_TOC = "## Table of Contents"
 
@@ -20,13 +20,18 @@ Module for miscellaneous utility functions and classes used in this project.
 # You should have received a copy of the GNU Lesser General Public License along with this library; if not, write to
 # the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
 
-import codecs
+import base64
 import hashlib
 import logging
 import os
 import re
+import shutil
 import subprocess
-from typing import List, TYPE_CHECKING, TextIO
+import threading
+import uuid
+from functools import lru_cache, wraps
+from queue import Queue
+from typing import List, Optional, TYPE_CHECKING, TextIO
 
 from Test_Reporting.utility.constants import DATA_SUBDIR, HEADING_TOC
 
@@ -37,6 +42,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of results to cache for each of the filename-checking functions
+FILENAME_CHECK_CACHE_SIZE = 1024
+
 
 def log_entry_exit(my_logger, level=logging.DEBUG):
     """Decorator which, when applied to a function, will log upon entry/exit of the function the name of the
@@ -55,7 +63,14 @@ def log_entry_exit(my_logger, level=logging.DEBUG):
     """
 
     def func_wrap(func):
+        @wraps(func)
         def wrap(*args, **kwargs):
+            # Skip straight to calling the function if logging at this level is disabled, so that this wrapper adds
+            # minimal overhead. This is checked at call time rather than decoration time, as logging is typically
+            # configured after modules have been imported
+            if not my_logger.isEnabledFor(level):
+                return func(*args, **kwargs)
+
             my_logger.log(level, "Entering method `%s` with positional arguments `%s` and keyword arguments `%s`.",
                           func.__qualname__, args, kwargs)
             output = func(*args, **kwargs)
@@ -174,8 +189,12 @@ def extract_tarball(qualified_results_tarball_filename, qualified_tmpdir):
         raise ValueError(f"Qualified tempdir {qualified_tmpdir} failed security check. It must"
                          f"contain only alphanumeric characters and [-_./+].")
 
-    cmd = f"cd {qualified_tmpdir} && tar -xf {qualified_results_tarball_filename}"
-    tar_results = subprocess.run(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    # Invoke the native `tar` binary directly rather than through a shell, having it change into the target directory
+    # itself. We don't need the extracted files to keep their original owners, so we tell `tar` not to restore these
+    # (`-o`), which saves a syscall for each extracted file when run as root. Modification times are still restored, as
+    # these are used to check whether reports are up-to-date
+    cmd = ["tar", "-xof", qualified_results_tarball_filename, "-C", qualified_tmpdir]
+    tar_results = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
     if tar_results.returncode:
         if "No such file" in str(tar_results.stderr):
@@ -237,6 +256,7 @@ def tar_files(tarball_filename,
                 logger.warning("Cannot delete file: %s", qualified_filename)
 
 
+@lru_cache(maxsize=FILENAME_CHECK_CACHE_SIZE)
 @log_entry_exit(logger)
 def is_valid_tarball_filename(tarball_filename: str) -> bool:
     """Checks that a filename is valid and safe for a tarball."""
@@ -244,6 +264,7 @@ def is_valid_tarball_filename(tarball_filename: str) -> bool:
     return bool(filename_regex_match)
 
 
+@lru_cache(maxsize=FILENAME_CHECK_CACHE_SIZE)
 @log_entry_exit(logger)
 def is_valid_xml_filename(xml_filename: str) -> bool:
     """Checks that a filename is valid for an XML file."""
@@ -251,6 +272,7 @@ def is_valid_xml_filename(xml_filename: str) -> bool:
     return bool(filename_regex_match)
 
 
+@lru_cache(maxsize=FILENAME_CHECK_CACHE_SIZE)
 @log_entry_exit(logger)
 def is_valid_json_filename(json_filename: str) -> bool:
     """Checks that a filename is valid for a JSON file."""
@@ -293,17 +315,14 @@ def hash_any(obj, max_length=None):
     hash : str
     """
 
-    full_hash = hashlib.sha256(repr(obj).encode()).hexdigest()
-
-    # Recode it into base 64. Note that this results in a stray newline character
-    # at the end, so we remove that.
-    full_hash = codecs.encode(codecs.decode(full_hash, 'hex'), 'base64')[:-1]
+    # Encode the raw digest directly into base 64, rather than going through its hex representation
+    full_hash = base64.b64encode(hashlib.sha256(repr(obj).encode()).digest())
 
     # This also allows the / character which we can't use, so replace it with .
     # Also decode it into a standard string
     full_hash = full_hash.decode().replace("/", ".")
 
-    if max_length is not None and len(full_hash) > max_length:
+    if max_length is not None:
         full_hash = full_hash[:max_length]
 
     return full_hash
@@ -349,6 +368,9 @@ class TocMarkdownWriter:
     """Class to help with writing Markdown files which include a Table of Contents.
     """
 
+    # Note that the methods to add lines and headings aren't decorated with `log_entry_exit`, as they're called many
+    # times for each report, and logging their entry and exit wouldn't be informative
+
     @log_entry_exit(logger)
     def __init__(self, title):
         """Initializes this writer, setting the desired title of the page.
@@ -367,7 +389,6 @@ class TocMarkdownWriter:
         self._l_lines: List[str] = []
         self._l_toc_lines: List[str] = []
 
-    @log_entry_exit(logger)
     def add_line(self, line):
         """Add a standard line to be written as part of the body text of the file. Note that this class does not
         automatically add linebreaks after lines, so the line added here must include any desired linebreaks. This
@@ -380,7 +401,17 @@ class TocMarkdownWriter:
         """
         self._l_lines.append(line)
 
-    @log_entry_exit(logger)
+    def add_lines(self, l_lines):
+        """Add multiple standard lines at once to be written as part of the body text of the file, in the same manner
+        as `add_line`.
+
+        Parameters
+        ----------
+        l_lines : Iterable[str]
+            The lines to be written, each including any desired linebreaks afterwards.
+        """
+        self._l_lines.extend(l_lines)
+
     def add_heading(self, heading, depth):
         """Add a heading line to be included at this point in the file, which will also be linked from the table-of
         contents.
@@ -421,6 +452,26 @@ class TocMarkdownWriter:
         self._l_lines.append("#" * (depth + 2) + f" {heading} <a id=\"{label}\"></a>\n\n")
         self._l_toc_lines.append("  " * depth + f"1. [{heading}](#{label})\n")
 
+    def get_text(self) -> str:
+        """Gets the full text of the TOC and all lines added to this object, as it would be written out by `write`.
+
+        Returns
+        -------
+        text : str
+        """
+
+        l_text = [f"# {self.title}\n\n"]
+
+        # Only write a Table of Contents if there's more than one heading; otherwise it's not worth it
+        if len(self._l_toc_lines) > 1:
+            l_text.append(f"{HEADING_TOC}\n\n")
+            l_text += self._l_toc_lines
+            l_text.append("\n")
+
+        l_text += self._l_lines
+
+        return "".join(l_text)
+
     @log_entry_exit(logger)
     def write(self, fo: TextIO):
         """Writes out the TOC and all lines added to this object.
@@ -431,17 +482,69 @@ class TocMarkdownWriter:
             The text filehandle to write to.
         """
 
-        fo.write(f"# {self.title}\n\n")
+        # Assemble the full text first and write it out in one go, to avoid many small writes to the filehandle
+        fo.write(self.get_text())
 
-        # Only write a Table of Contents if there's more than one heading; otherwise it's not worth it
-        if len(self._l_toc_lines) > 1:
 
-            fo.write(f"{HEADING_TOC}\n\n")
+class AsyncDirectoryRemover:
+    """Class to remove directories in a background thread. Each directory to be removed is first renamed into a
+    "trash" directory, which is quick, so that the caller can continue immediately, and then the background thread
+    removes it from there.
+    """
+
+    @log_entry_exit(logger)
+    def __init__(self, qualified_trash_dir):
+        """Initializes this remover and starts its background thread.
 
-            for line in self._l_toc_lines:
-                fo.write(line)
+        Parameters
+        ----------
+        qualified_trash_dir : str
+            The fully-qualified path to an existing, empty directory to move directories into before removing them.
+            For moves to be quick, this should be on the same filesystem as the directories to be removed. This
+            directory will itself be removed when `close` is called.
+        """
+
+        self.qualified_trash_dir = qualified_trash_dir
+
+        self._q_dirs: "Queue[Optional[str]]" = Queue()
+        self._thread = threading.Thread(target=self._remove_queued_dirs, daemon=True)
+        self._thread.start()
+
+    @log_entry_exit(logger)
+    def _remove_queued_dirs(self):
+        """Loop run by the background thread, which removes directories until it receives None from the queue.
+        """
+        while True:
+            qualified_dir = self._q_dirs.get()
+            if qualified_dir is None:
+                return
+            shutil.rmtree(qualified_dir, ignore_errors=True)
 
-            fo.write("\n")
+    @log_entry_exit(logger)
+    def remove(self, qualified_dir):
+        """Schedules a directory to be removed. If it can't be moved into the trash directory, it will instead be
+        removed immediately.
+
+        Parameters
+        ----------
+        qualified_dir : str
+            The fully-qualified path to the directory to remove
+        """
+
+        qualified_trashed_dir = os.path.join(self.qualified_trash_dir, uuid.uuid4().hex)
+        try:
+            os.rename(qualified_dir, qualified_trashed_dir)
+        except OSError:
+            shutil.rmtree(qualified_dir)
+            return
+
+        self._q_dirs.put(qualified_trashed_dir)
+
+    @log_entry_exit(logger)
+    def close(self):
+        """Waits for all scheduled directories to be removed, and then removes the trash directory.
+        """
 
-        for line in self._l_lines:
-            fo.write(line)
+        self._q_dirs.put(None)
+        self._thread.join()
+        shutil.rmtree(self.qualified_trash_dir, ignore_errors=True)
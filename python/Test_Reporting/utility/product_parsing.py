@@ -17,7 +17,8 @@ it from the XML element which contains the corresponding data.
 The `parse_xml_product` method is used to construct the full `TestResults` object hierarchically - its
 `make_from_element` method is called on the root element of the XML file, it reads in simple elements from the XML
 file directly (converting to the expected types) and constructs other dataclasses via their own `make_from_element`
-methods, which proceed similarly.
+methods, which proceed similarly. To keep memory use bounded for large products, `parse_xml_product` streams the file
+and constructs each `SingleTestResult` as soon as its element has been read in, discarding the element afterwards.
 
 If the structure of the SheValidationTestResults data products changes, this module will need to be updated to reflect
 those changes. Similarly, not all the XML file's metadata is currently being read in here; if some missing data
@@ -39,6 +40,7 @@ is later needed, this will also have to be updated.
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from logging import getLogger
 from typing import Any, List, Optional, Type
 from xml.etree import ElementTree
@@ -48,6 +50,15 @@ from Test_Reporting.utility.misc import ensure_data_prefix, log_entry_exit
 
 logger = getLogger(__name__)
 
+# The tag of the elements containing the results for each test case, and the depth of them within the tree (the number
+# of elements enclosing them, including the root element)
+TEST_LIST_TAG = "ValidationTestList"
+TEST_LIST_DEPTH = 2
+
+# Abbreviated names of each month, used when formatting dates. These are used rather than `strftime("%b")` so that the
+# output doesn't depend on the locale
+MONTH_ABBREVIATIONS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
 
 @dataclass
 class MeasuredValue:
@@ -271,9 +282,17 @@ class TestResults:
     # Data
     l_test_results: List[SingleTestResult] = field(default_factory=list)
 
+    @cached_property
+    def formatted_creation_date(self) -> str:
+        """The creation date and time of this product, formatted for display, e.g. "3 Dec, 2021 at 11:24:43.408000".
+        This is cached after it's first calculated.
+        """
+        t = self.creation_date
+        return f"{t.day} {MONTH_ABBREVIATIONS[t.month - 1]}, {t.year} at {t.time()}"
+
     @classmethod
     @log_entry_exit(logger)
-    def make_from_element(cls, e):
+    def make_from_element(cls, e, l_test_results=None):
         """Construct an instance of this class from a corresponding XML element. In the case of this class,
         it should be constructed from the root element of the ElementTree.
 
@@ -281,14 +300,19 @@ class TestResults:
         ----------
         e : Element
             The root element of the ElementTree of an opened SheValidationTestResults XML data product.
+        l_test_results : List[SingleTestResult] or None, default=None
+            If provided, this will be used as the list of results for each test case, rather than constructing it from
+            the `root.Data.ValidationTestList` elements of `e`. This allows these elements to be parsed and discarded
+            while the product is being read in.
 
         Returns
         -------
         TestResults
         """
 
-        l_test_results = [SingleTestResult.make_from_element(sub_e) for sub_e in
-                          _element_find(e, "Data.ValidationTestList", find_all=True)]
+        if l_test_results is None:
+            l_test_results = [SingleTestResult.make_from_element(sub_e) for sub_e in
+                              _element_find(e, "Data.ValidationTestList", find_all=True)]
         creation_date = _construct_datetime(_element_find(e, "Header.CreationDate", output_type=str))
 
         return TestResults(product_id=_element_find(e, "Header.ProductId", output_type=str),
@@ -307,7 +331,6 @@ class TestResults:
                            l_test_results=l_test_results)
 
 
-@log_entry_exit(logger)
 def _element_find(element, tag, find_all=False, output_type=None):
     """Gets a sub-element or list thereof from an XML ElementTree Element, searching recursively as necessary,
     optionally converting it into an object of the provided type.
@@ -334,6 +357,9 @@ def _element_find(element, tag, find_all=False, output_type=None):
         instead.
     """
 
+    # Note that this function isn't decorated with `log_entry_exit`, as it's called (recursively) for every field of
+    # every element parsed
+
     # Check for simple case, to break out of recursion
     if "." not in tag:
         if find_all:
@@ -359,8 +385,7 @@ def _construct_datetime(s: str) -> datetime:
     # Pad milliseconds with zeros if it's been truncated
     s_before_z = s.split('Z')[0]
     s_before_milli, s_milli = s_before_z.split('.')
-    while len(s_milli) < 3:
-        s_milli += "0"
+    s_milli = s_milli.ljust(3, "0")
 
     # Reconstruct in ISO format
     s_iso = f"{s_before_milli}.{s_milli}+00:00"
@@ -383,14 +408,31 @@ def parse_xml_product(filename):
 
     Parameters
     ----------
-    filename : str
-        The fully-qualified filename of the SheValidationTestResults XML product to parse
+    filename : str or BinaryIO
+        The fully-qualified filename of the SheValidationTestResults XML product to parse, or a binary file object
+        opened to read it
 
     Returns
     -------
     parsed_xml_product : TestResults
     """
 
-    tree = ElementTree.parse(filename)
+    # We stream the file rather than reading the full tree into memory, parsing each `root.Data.ValidationTestList`
+    # element into a SingleTestResult as soon as it's complete and then removing it from the tree. The rest of the tree
+    # (the header and the rest of the data section) is kept, and parsed once the full file has been read
+    l_test_results: List[SingleTestResult] = []
+    l_open_elements: List[Element] = []
+
+    for event, e in ElementTree.iterparse(filename, events=("start", "end")):
+
+        if event == "start":
+            l_open_elements.append(e)
+            continue
+
+        l_open_elements.pop()
+
+        if e.tag == TEST_LIST_TAG and len(l_open_elements) == TEST_LIST_DEPTH:
+            l_test_results.append(SingleTestResult.make_from_element(e))
+            l_open_elements[-1].remove(e)
 
-    return TestResults.make_from_element(tree.getroot())
+    return TestResults.make_from_element(e, l_test_results=l_test_results)
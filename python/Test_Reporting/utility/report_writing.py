@@ -32,18 +32,30 @@ the instructions below.
 
 from __future__ import annotations
 
+import hashlib
 import os
+import secrets
 import shutil
+import tarfile
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
 from logging import getLogger
-from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, TYPE_CHECKING, Tuple, Union
+from operator import attrgetter, countOf
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Set, TYPE_CHECKING, Tuple, Union
 
-from astropy.io.registry import IORegistryError
+from astropy.io.registry import IORegistryError, identify_format
 from astropy.table import Table
 
-from Test_Reporting.utility.constants import DATA_DIR, IMAGES_SUBDIR, PUBLIC_DIR, TEST_REPORTS_SUBDIR
-from Test_Reporting.utility.misc import (TocMarkdownWriter, extract_tarball, get_data_filename, get_qualified_path,
-                                         hash_any, is_valid_tarball_filename, is_valid_xml_filename, log_entry_exit, )
+from Test_Reporting.utility.constants import (DATA_DIR, IMAGES_SUBDIR, PUBLIC_DIR, TEST_REPORTS_SUBDIR,
+                                              WRITE_BUFFER_SIZE, )
+from Test_Reporting.utility.misc import (AsyncDirectoryRemover, TocMarkdownWriter, extract_tarball, get_data_filename,
+                                         get_qualified_path, is_valid_tarball_filename, is_valid_xml_filename,
+                                         log_entry_exit, )
 from Test_Reporting.utility.product_parsing import parse_xml_product
 
 if TYPE_CHECKING:
@@ -52,6 +64,21 @@ if TYPE_CHECKING:
                                                         SingleTestResult, TestResults, )  # noqa F401
 
 TMPDIR_MAXLEN = 16
+TRASH_DIR_PREFIX = "tmp_trash_"
+
+TEST_CASE_NAMES_CACHE_SIZE = 256
+PARSED_PRODUCT_CACHE_SIZE = 64
+PRODUCT_DIGEST_SIZE = 16
+
+MAX_PARSE_THREADS = 32
+MAX_PARSE_PROCESSES = os.cpu_count() or 1
+# Writing report files is I/O-bound, so we allow a number of threads for it which scales with the number of CPUs, in
+# the same way as the default for `ThreadPoolExecutor`
+MAX_WRITE_THREADS = min(32, (os.cpu_count() or 1) * 4)
+# The maximum total length of report text to hold in memory waiting to be written out, beyond which pending writes are
+# flushed early
+MAX_PENDING_WRITE_SIZE = 1 << 26
+MAX_TEST_CASE_THREADS = 32
 
 DIRECTORY_FILE_EXT = ".txt"
 DIRECTORY_FILE_TEXTFILES_HEADER = "# Textfiles:"
@@ -71,6 +98,30 @@ HEADING_TEXTFILE_N = "Textfile #%i"
 
 MSG_NA = "N/A"
 
+# The header and separator lines of the table of test cases in a test's summary
+TEST_CASE_TABLE_HEADER = ("| **Test Case** | **Result** |\n"
+                          "| :------------ | :--------- |\n")
+
+# The optional metadata fields of a TestResults object to report on, as (label, attribute name) pairs
+L_TEST_METADATA_FIELDS = (("Exposure Product ID", "exp_product_id"),
+                          ("Observation ID", "obs_id"),
+                          ("Pointing ID", "pnt_id"),
+                          ("Number of Exposures", "n_exp"),
+                          ("Tile ID", "tile_id"),
+                          ("Observation Mode", "obs_mode"),)
+L_TEST_METADATA_LABELS = tuple(label for label, _ in L_TEST_METADATA_FIELDS)
+_get_test_metadata_values = attrgetter(*(attr for _, attr in L_TEST_METADATA_FIELDS))
+
+# The path to the images directory, relative to the directory test reports are stored in
+RELATIVE_IMAGES_DIR = f"../{IMAGES_SUBDIR}/"
+
+# Prefix for the paths of test reports relative to the report directory. Paths here are all POSIX-style, so we can
+# format them directly rather than going through `os.path.join` for each test case
+TEST_REPORTS_PREFIX = f"{TEST_REPORTS_SUBDIR}/"
+TEST_REPORTS_PREFIX_LEN = len(TEST_REPORTS_PREFIX)
+
+MD_EXT_LEN = len(".md")
+HTML_EXT = ".html"
 MSG_TARBALL_CORRUPT = "Tarball %s appears to be corrupt."
 
 MSG_LINE_LIMIT = ("(only first %i lines of %s shown. The full textfile may be "
@@ -84,6 +135,9 @@ MSG_MD_TABLE_LIMIT = MSG_LINE_LIMIT % (MD_TABLE_LINE_LIMIT, "tables")
 TEXTFILE_LINE_LIMIT = 100
 MSG_TEXTFILE_LIMIT = f"...\n{MSG_LINE_LIMIT % (TEXTFILE_LINE_LIMIT, 'textfiles')}"
 
+# Translation table to remove linebreaks from the items in a table, which would otherwise break its formatting
+LINEBREAK_STRIP_TABLE = str.maketrans("", "", "\n\r")
+
 logger = getLogger(__name__)
 
 
@@ -104,6 +158,13 @@ class ValTestCaseMeta(NamedTuple):
     filename: str
     passed: Optional[bool] = None
 
+    @property
+    def relative_html_filename(self) -> str:
+        """The filename of the compiled HTML version of this test case's report, relative to the directory test
+        reports are stored in.
+        """
+        return f"{self.filename[TEST_REPORTS_PREFIX_LEN:-MD_EXT_LEN]}{HTML_EXT}"
+
 
 class ValTestMeta(NamedTuple):
     """Named tuple to contain output of a test's name and filename, and a list of the same for all associated
@@ -124,6 +185,186 @@ BUILD_CALLABLE_TYPE = Callable[[Union[str, Dict[str, str]],
                                 OutputFormat], List[ValTestMeta]]
 
 
+@lru_cache(maxsize=None)
+def _get_figure_heading(i: int) -> str:
+    """Gets the default heading for the figure with index `i`, caching the result as it will be reused for each test
+    case.
+    """
+    return HEADING_FIGURE_N % i
+
+
+@lru_cache(maxsize=None)
+def _get_textfile_heading(i: int) -> str:
+    """Gets the default heading for the textfile with index `i`, caching the result as it will be reused for each test
+    case.
+    """
+    return HEADING_TEXTFILE_N % i
+
+
+@log_entry_exit(logger)
+def _get_l_indexed_ana_files(l_ana_files_labels_and_filenames: Sequence[FileInfo],
+                             is_figure: bool) -> List[Tuple[int, FileInfo]]:
+    """Gets a list of (index, FileInfo) tuples for only the figures or only the textfiles in a list of analysis files,
+    where the index is the position in the full list.
+    """
+    return [(i, file_info) for i, file_info in enumerate(l_ana_files_labels_and_filenames)
+            if file_info.is_figure == is_figure]
+
+
+@log_entry_exit(logger)
+def _link_tree(qualified_src_dir: str, qualified_dest_dir: str) -> List[str]:
+    """Makes all files within a directory tree available within another directory, by hard-linking each file to the
+    corresponding location, or copying it if it can't be linked. Any files already present at the destination are
+    replaced. Returns the names of the files at the top level of the tree, which are found along the way.
+    """
+
+    l_top_level_filenames: List[str] = []
+
+    for qualified_src_subdir, _, l_filenames in os.walk(qualified_src_dir):
+        if qualified_src_subdir == qualified_src_dir:
+            l_top_level_filenames = l_filenames
+
+        qualified_dest_subdir = os.path.join(qualified_dest_dir, os.path.relpath(qualified_src_subdir,
+                                                                                 qualified_src_dir))
+        os.makedirs(qualified_dest_subdir, exist_ok=True)
+
+        # Determine the paths of the directories once here, so the paths of each file within them can be formatted
+        # directly
+        src_prefix = f"{qualified_src_subdir}{os.sep}"
+        dest_prefix = f"{qualified_dest_subdir}{os.sep}"
+
+        for filename in l_filenames:
+            qualified_src_filename = f"{src_prefix}{filename}"
+            qualified_dest_filename = f"{dest_prefix}{filename}"
+
+            # The destination is usually empty, so we only check for and remove an existing file if linking fails
+            try:
+                os.link(qualified_src_filename, qualified_dest_filename)
+            except FileExistsError:
+                os.remove(qualified_dest_filename)
+                try:
+                    os.link(qualified_src_filename, qualified_dest_filename)
+                except OSError:
+                    shutil.copy2(qualified_src_filename, qualified_dest_filename)
+            except OSError:
+                shutil.copy2(qualified_src_filename, qualified_dest_filename)
+
+    return l_top_level_filenames
+
+
+@lru_cache(maxsize=PARSED_PRODUCT_CACHE_SIZE)
+@log_entry_exit(logger)
+def parse_xml_product_cached(qualified_filename: str, mtime_ns: int, size: int) -> TestResults:
+    """Parses a SheValidationTestResults XML product, caching the result so that it need only be parsed once if it's
+    reported on multiple times. The file's modification time and size are included in the arguments so that the
+    cached result won't be used if the file has changed. Note that the returned object is shared between all calls
+    which use the cached result, and so must not be modified.
+
+    Parameters
+    ----------
+    qualified_filename : str
+        The fully-qualified filename of the SheValidationTestResults XML product to parse.
+    mtime_ns : int
+        The modification time of the file, in nanoseconds, as returned by `os.stat`.
+    size : int
+        The size of the file in bytes, as returned by `os.stat`.
+
+    Returns
+    -------
+    test_results : TestResults
+    """
+    return parse_xml_product(qualified_filename)
+
+
+@lru_cache(maxsize=TEST_CASE_NAMES_CACHE_SIZE)
+@log_entry_exit(logger)
+def get_unique_test_case_names(t_root_names: Tuple[str, ...], test_name_tail: str) -> Tuple[str, ...]:
+    """Generates unique names for a sequence of test cases from the root names for each, appending an index to the
+    root name in the case of clashes, e.g. "ID", "ID-2", "ID-3", etc., and then the provided tail. As this is a
+    deterministic function of its (hashable) input, the results are cached so that repeated reports on the same set
+    of test cases don't need to recompute them.
+
+    Parameters
+    ----------
+    t_root_names : Tuple[str, ...]
+        The root name for each test case, which may not be unique.
+    test_name_tail : str
+        A string to be appended to the name of each test case.
+
+    Returns
+    -------
+    t_test_case_names : Tuple[str, ...]
+        The unique name for each test case, in the same order as `t_root_names`.
+    """
+
+    d_test_name_instances: Dict[str, int] = {}
+    l_test_case_names: List[str] = []
+
+    for root_name in t_root_names:
+
+        num_instances = d_test_name_instances.get(root_name, 0) + 1
+        d_test_name_instances[root_name] = num_instances
+        if num_instances > 1:
+            test_case_name = f"{root_name}-{num_instances}{test_name_tail}"
+        else:
+            test_case_name = f"{root_name}{test_name_tail}"
+
+        l_test_case_names.append(test_case_name)
+
+    return tuple(l_test_case_names)
+
+
+@log_entry_exit(logger)
+def _get_l_table_row_strs(table: Table, max_rows: int) -> List[Tuple[str, ...]]:
+    """Converts the items in the first `max_rows` rows of an astropy table into strings with linebreaks removed,
+    returning a list of tuples of the strings for each row. The conversion is done column-by-column, which avoids the
+    cost of constructing a `Row` object for each row of the table.
+    """
+    l_col_strs = [[str(item).translate(LINEBREAK_STRIP_TABLE) for item in col] for col in table[:max_rows].itercols()]
+    return list(zip(*l_col_strs))
+
+
+def _write_text_file(qualified_filename_and_text: Tuple[str, str]) -> None:
+    """Writes text out to a file in a single write call, taking a (fully-qualified filename, text) tuple. The text is
+    encoded to UTF-8 all at once and written in binary mode, bypassing the text-mode I/O layer. This isn't decorated
+    with `log_entry_exit`, as that would log the full text of every report.
+    """
+    qualified_filename, text = qualified_filename_and_text
+    payload = text.encode("utf-8")
+    with open(qualified_filename, "wb", buffering=WRITE_BUFFER_SIZE) as fo:
+        fo.write(payload)
+
+
+def _is_outside_root(normalised_filename: str) -> bool:
+    """Checks if a normalised relative filename would resolve to outside of the directory it's relative to.
+    """
+    return os.path.isabs(normalised_filename) or normalised_filename.split(os.sep, 1)[0] == os.pardir
+
+
+@log_entry_exit(logger)
+def _extract_tar_member_product(tf: tarfile.TarFile, member: tarfile.TarInfo, qualified_filename: str) -> bytes:
+    """Extracts a data product from a member of an opened tarball to the provided fully-qualified filename, returning a
+    digest of its contents, which can be used to identify duplicate copies of the same product.
+    """
+    with tf.extractfile(member) as fi:
+        product_bytes = fi.read()
+    os.makedirs(os.path.dirname(qualified_filename), exist_ok=True)
+    with open(qualified_filename, "wb") as fo:
+        fo.write(product_bytes)
+    return hashlib.blake2b(product_bytes, digest_size=PRODUCT_DIGEST_SIZE).digest()
+
+
+@log_entry_exit(logger)
+def _extract_tar_member(tf: tarfile.TarFile, member: tarfile.TarInfo, qualified_filename: str) -> None:
+    """Extracts a single regular file from an opened tarball to the provided fully-qualified filename, restoring its
+    modification time (which is used to check whether reports are up-to-date) but not its owner or permissions.
+    """
+    os.makedirs(os.path.dirname(qualified_filename), exist_ok=True)
+    with tf.extractfile(member) as fi, open(qualified_filename, "wb") as fo:
+        shutil.copyfileobj(fi, fo)
+    os.utime(qualified_filename, (member.mtime, member.mtime))
+
+
 class FileInfo(NamedTuple):
     """NamedTuple containing file label, filename, and whether or not it's a figure.
     """
@@ -324,6 +565,15 @@ class ReportSummaryWriter:
     # Same as `has_figures`, but for textfiles
     has_textfiles: bool = True
 
+    # If set to True, the report page for a test case won't be rebuilt if it already exists and is newer than the
+    # results file and any analysis files tarballs it was built from
+    skip_unchanged: bool = False
+
+    # If set to True, when there are multiple data products to report on, they will be parsed in parallel with a pool
+    # of processes rather than threads. This allows parsing to use multiple cores, at the cost of the overhead of
+    # starting the processes and passing the parsed results back, so is only worthwhile for many large products
+    parse_in_processes: bool = False
+
     # Instance attributes. These are set from arguments supplied to a public method, and are kept unchanged during
     # the execution of that method
 
@@ -333,12 +583,57 @@ class ReportSummaryWriter:
     _datadir: Optional[str] = None
     _output_format: Optional[OutputFormat] = None
 
+    # Whether `_output_format` is HTML (if not, it's MD), determined once when it's set so it can be cheaply checked
+    _is_html: bool = True
+
+    # The fully-qualified paths to the report and images directories, with a trailing "/", so paths within them can be
+    # formatted directly
+    _reportdir_prefix: Optional[str] = None
+    _qualified_images_prefix: Optional[str] = None
+
+    # Object used to remove tmpdirs in the background during execution of the `__call__` method
+    _dir_remover: Optional[AsyncDirectoryRemover] = None
+
+    # Instance attributes used by the `_summarize_results_file` method
+    _results_mtime_ns: int = 0
+
+    # The set of fully-qualified directories which have already been ensured to exist during the current execution of
+    # the `__call__` method. This is reset for each call, as the output directories may be removed between them
+    _s_ensured_dirs: Set[str]
+
+    # Private instance attributes, kept through the lifetime of this object
+
+    # Report files which have been built but not yet written out, as (fully-qualified filename, text) tuples, plus the
+    # total length of their text, and a lock to guard these, as reports may be queued from multiple threads
+    _l_pending_writes: List[Tuple[str, str]]
+    _pending_write_size: int
+    _pending_writes_lock: threading.Lock
+
+    # Directories which analysis files tarballs have already been extracted into, keyed by (fully-qualified filename,
+    # modification time in ns, size) of each tarball, plus locks for each key, and a lock to guard creation of those
+    _d_extracted_tarball_dirs: Dict[Tuple[str, int, int], str]
+    _d_extracted_tarball_locks: Dict[Tuple[str, int, int], threading.Lock]
+    _extracted_tarballs_lock: threading.Lock
+
+    # Fully-qualified filenames of datafiles referenced by the product currently being reported on (or None if not
+    # found), keyed by (filename as given in the product, data directory)
+    _d_data_filenames: Dict[Tuple[str, str], Optional[str]]
+
     @log_entry_exit(logger)
     def __init__(self, **kwargs):
         """Initializer for ReportSummaryWriter, which allows specifying any desired attributes via kwargs. The
         allowed attributes are listed as class attributes above
         """
 
+        self._s_ensured_dirs = set()
+        self._l_pending_writes = []
+        self._pending_write_size = 0
+        self._pending_writes_lock = threading.Lock()
+        self._d_extracted_tarball_dirs = {}
+        self._d_extracted_tarball_locks = {}
+        self._extracted_tarballs_lock = threading.Lock()
+        self._d_data_filenames = {}
+
         for key, value in kwargs.items():
             if not hasattr(self, key):
                 raise ValueError(
@@ -352,7 +647,7 @@ class ReportSummaryWriter:
 
         Parameters
         ----------
-        value : str or Dict[str, str]
+        value : str or Dict[str, str] or None
             The value provided in the .json manifest for this test. This should be either the filename of a tarball
             containing the test results product and associated datafiles, the filename of the data product,
             or a dict of keys pointing to multiple such files.
@@ -375,34 +670,52 @@ class ReportSummaryWriter:
         l_test_meta : List[ValTestMeta]
             A list of objects, each containing the test name and filename and a list of the same for associated
             tests. If the input `value` is a filename, this will be a single-element list. If the input `value` is
-            instead a dict, this will have multiple elements, depending on the number of elements in the dict.
+            instead a dict, this will have multiple elements, depending on the number of elements in the dict. If the
+            input `value` is None or an empty dict, this will be an empty list.
         """
 
+        # Exit early if there's nothing to report on, before doing any setup
+        if value is None or (isinstance(value, dict) and len(value) == 0):
+            return []
+
         # Set instance attributes used during execution of this method based on arguments
         self._rootdir = rootdir
         self._datadir = datadir
+        if not isinstance(output_format, OutputFormat):
+            raise ValueError(f"Unrecognized output format: {output_format=}")
         self._output_format = output_format
+        self._is_html = output_format is OutputFormat.HTML
+        self._s_ensured_dirs = set()
 
         if reportdir is not None:
             self._reportdir = reportdir
         else:
             self._reportdir = os.path.join(rootdir, PUBLIC_DIR)
+        self._reportdir_prefix = self._reportdir if self._reportdir.endswith("/") else f"{self._reportdir}/"
+        self._qualified_images_prefix = f"{self._reportdir_prefix}{IMAGES_SUBDIR}/"
 
-        # Figure out how to interpret `value` by checking if it's a str or dict, and then iterate over call to
-        # process each individual tarball
-        l_test_meta: List[ValTestMeta]
-        if isinstance(value, str):
-            l_test_meta = self._summarize_results_file(value,
-                                                       tag=None)
-        elif isinstance(value, dict):
-            l_test_meta = []
-            for sub_key, sub_value in value.items():
-                l_test_meta += self._summarize_results_file(sub_value,
-                                                            tag=sub_key)
-        else:
-            raise ValueError("Value in manifest is of unrecognized type.\n"
-                             f"Value was: {value}\n"
-                             f"Type was: {type(value)}")
+        # Set up to remove tmpdirs in the background while we work, making sure this is finished before we return
+        self._dir_remover = AsyncDirectoryRemover(tempfile.mkdtemp(prefix=TRASH_DIR_PREFIX, dir=self._rootdir))
+
+        try:
+            # Figure out how to interpret `value` by checking if it's a str or dict, and then iterate over call to
+            # process each individual tarball
+            l_test_meta: List[ValTestMeta]
+            if isinstance(value, str):
+                l_test_meta = self._summarize_results_file(value,
+                                                           tag=None)
+            elif isinstance(value, dict):
+                l_test_meta = []
+                for sub_key, sub_value in value.items():
+                    l_test_meta += self._summarize_results_file(sub_value,
+                                                                tag=sub_key)
+            else:
+                raise ValueError("Value in manifest is of unrecognized type.\n"
+                                 f"Value was: {value}\n"
+                                 f"Type was: {type(value)}")
+        finally:
+            self._dir_remover.close()
+            self._dir_remover = None
 
         return l_test_meta
 
@@ -432,27 +745,40 @@ class ReportSummaryWriter:
         # Make sure the results_filename is fully-qualified
         results_filename = get_qualified_path(results_filename, base=os.path.join(self._rootdir, DATA_DIR))
 
+        if self.skip_unchanged:
+            self._results_mtime_ns = os.stat(results_filename).st_mtime_ns
+
         # Split execution depending on if we're passed a tarball or an XML data product
 
         if is_valid_tarball_filename(results_filename):
-            qualified_tmp_datadir = self._make_tmpdir(results_filename)
+            qualified_tmp_datadir = self._make_tmpdir()
 
             # We use a try-finally block here to ensure the created datadir is removed after use
             try:
-                qualified_results_tarball_filename = os.path.join(self._rootdir, DATA_DIR, results_filename)
-                l_test_meta = self._summarize_results_tarball_with_tmpdir(qualified_results_tarball_filename,
-                                                                          qualified_tmp_datadir,
-                                                                          tag=tag)
+                if self.has_figures or self.has_textfiles:
+                    l_test_meta = self._summarize_results_tarball_with_tmpdir(results_filename,
+                                                                              qualified_tmp_datadir,
+                                                                              tag=tag)
+                else:
+                    # We won't need any of the data files in the tarball, so just read the products from it
+                    l_test_meta = self._summarize_results_tarball_streaming(results_filename,
+                                                                            qualified_tmp_datadir,
+                                                                            tag=tag)
             finally:
-                shutil.rmtree(qualified_tmp_datadir)
+                self._remove_tmpdir(qualified_tmp_datadir)
         elif is_valid_xml_filename(results_filename):
             if self._datadir is not None:
                 qualified_tmp_datadir = self._datadir
             else:
-                qualified_tmp_datadir = os.path.split(results_filename)[0]
-            l_test_meta = self._summarize_results_product(l_product_filenames=[results_filename],
-                                                          qualified_tmp_datadir=qualified_tmp_datadir,
-                                                          tag=tag)
+                qualified_tmp_datadir = os.path.dirname(results_filename)
+            # Products provided directly may be reported on repeatedly (e.g. through multiple manifest entries), so
+            # we use the cached parsing function, keyed on the file's modification time and size so that the cache is
+            # invalidated if it changes
+            results_stat = os.stat(results_filename)
+            test_results = parse_xml_product_cached(results_filename, results_stat.st_mtime_ns, results_stat.st_size)
+            l_test_meta = self._summarize_test_results(l_test_results=[test_results],
+                                                       qualified_tmp_datadir=qualified_tmp_datadir,
+                                                       tag=tag)
         else:
             raise ValueError(f"Filename {results_filename} is neither a valid and safe tarball filename nor a valid "
                              "XML filename.")
@@ -460,13 +786,11 @@ class ReportSummaryWriter:
         return l_test_meta
 
     @log_entry_exit(logger)
-    def _make_tmpdir(self, hashable, qualified_enclosing_dir=None):
-        """We'll need a temporary directory to extract files into, so create one. Some unique hashable object must be
-        provided, whose hash will be used to generate a presumably-unique directory name.
+    def _make_tmpdir(self, qualified_enclosing_dir=None):
+        """We'll need a temporary directory to extract files into, so create one, with a randomly-generated name.
 
         Parameters
         ----------
-        hashable : Any
         qualified_enclosing_dir : Optional[str], default=self._rootdir
             The fully-qualified path to the directory in which the new tmpdir is to be created
 
@@ -479,7 +803,8 @@ class ReportSummaryWriter:
         if qualified_enclosing_dir is None:
             qualified_enclosing_dir = self._rootdir
 
-        tmpdir = "tmp_" + hash_any(hashable, max_length=TMPDIR_MAXLEN)
+        # The name only needs to be unique, so we use a random token rather than deriving it from anything
+        tmpdir = "tmp_" + secrets.token_hex(TMPDIR_MAXLEN // 2)
 
         # If this already exists, raise an exception - better to fail then to run into unexpected results from thread
         # clashes
@@ -488,13 +813,124 @@ class ReportSummaryWriter:
 
         return qualified_tmpdir
 
+    @log_entry_exit(logger)
+    def _get_data_filename(self, filename, qualified_datadir):
+        """Gets the fully-qualified filename of a datafile referenced by a data product, via `get_data_filename`. The
+        result is remembered until reporting on the current product is complete, as the same datafiles are commonly
+        referenced by multiple test cases, and are checked for multiple times for each.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the datafile as specified in the data product
+        qualified_datadir : str
+            The fully-qualified path to the data directory
+
+        Returns
+        -------
+        qualified_filename : str or None
+            The fully-qualified path to the filename if the file is found, None if it isn't found.
+        """
+
+        key = (filename, qualified_datadir)
+        try:
+            return self._d_data_filenames[key]
+        except KeyError:
+            pass
+
+        qualified_filename = get_data_filename(filename, qualified_datadir)
+        self._d_data_filenames[key] = qualified_filename
+        return qualified_filename
+
+    @log_entry_exit(logger)
+    def _ensure_dir(self, qualified_dir):
+        """Ensures that a directory exists, creating it if necessary. Directories which have already been ensured to
+        exist during the current call are remembered, so that this is only checked on disk once for each.
+
+        Parameters
+        ----------
+        qualified_dir : str
+            The fully-qualified path to the directory
+        """
+
+        if qualified_dir in self._s_ensured_dirs:
+            return
+
+        os.makedirs(qualified_dir, exist_ok=True)
+        self._s_ensured_dirs.add(qualified_dir)
+
+    @log_entry_exit(logger)
+    def _queue_write(self, qualified_filename, writer):
+        """Queues up the contents of a markdown writer to be written to a file the next time
+        `_flush_pending_writes` is called. The directory the file is in doesn't need to exist yet, as this will be
+        ensured when the writes are flushed. If the total size of the queued-up text exceeds
+        `MAX_PENDING_WRITE_SIZE`, the writes are flushed immediately, to keep memory use bounded.
+
+        Parameters
+        ----------
+        qualified_filename : str
+            The fully-qualified filename to write to
+        writer : TocMarkdownWriter
+        """
+
+        text = writer.get_text()
+
+        with self._pending_writes_lock:
+            self._l_pending_writes.append((qualified_filename, text))
+            self._pending_write_size += len(text)
+            flush_now = self._pending_write_size > MAX_PENDING_WRITE_SIZE
+
+        if flush_now:
+            self._flush_pending_writes()
+
+    @log_entry_exit(logger)
+    def _flush_pending_writes(self):
+        """Writes out all queued-up report files, using a pool of threads so that the writes can overlap. The
+        directories for all files are ensured to exist first, checking each unique directory only once.
+        """
+
+        with self._pending_writes_lock:
+            l_pending_writes = self._l_pending_writes
+            self._l_pending_writes = []
+            self._pending_write_size = 0
+
+        for qualified_dir in {os.path.dirname(qualified_filename) for qualified_filename, _ in l_pending_writes}:
+            self._ensure_dir(qualified_dir)
+
+        if len(l_pending_writes) <= 1:
+            for qualified_filename_and_text in l_pending_writes:
+                _write_text_file(qualified_filename_and_text)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WRITE_THREADS, len(l_pending_writes))) as executor:
+            # Consume the iterator so that any exceptions raised in the threads are raised here
+            list(executor.map(_write_text_file, l_pending_writes))
+
+    @log_entry_exit(logger)
+    def _remove_tmpdir(self, qualified_tmpdir):
+        """Removes a tmpdir once it's no longer needed. If called during execution of the `__call__` method, this is
+        done in the background, otherwise immediately.
+
+        Parameters
+        ----------
+        qualified_tmpdir : str
+            The fully-qualified path to the tmpdir
+        """
+
+        if self._dir_remover is not None:
+            self._dir_remover.remove(qualified_tmpdir)
+        else:
+            shutil.rmtree(qualified_tmpdir)
+
     @log_entry_exit(logger)
     def _summarize_results_tarball_with_tmpdir(self,
                                                qualified_results_tarball_filename,
                                                qualified_tmp_datadir,
-                                               tag=None):
+                                               tag=None,
+                                               extract_data=True):
         """Writes summary markdown files for the test results contained in a tarball of the test results product and
-        associated data, using a provided tmpdir for work.
+        associated data, using a provided tmpdir for work. Only the products and, if `extract_data` is set, the
+        associated datafiles which they reference are extracted into the tmpdir.
 
         Parameters
         ----------
@@ -503,36 +939,172 @@ class ReportSummaryWriter:
         qualified_tmp_datadir : str
             The fully-qualified path to a directory containing all data for this test
         tag : str or None
+        extract_data : bool, default=True
+            Whether to extract the datafiles referenced by the products
 
         Returns
         -------
         l_test_meta : List[ValTestMeta]
         """
 
-        extract_tarball(qualified_results_tarball_filename, qualified_tmp_datadir)
-
-        l_product_filenames = self._find_product_filenames(qualified_tmp_datadir)
-        l_qualified_product_filenames = [os.path.join(qualified_tmp_datadir, product_filename)
-                                         for product_filename in l_product_filenames]
+        l_test_results = self._read_results_tarball(qualified_results_tarball_filename, qualified_tmp_datadir,
+                                                    extract_data=extract_data)
 
         # Make sure the required subdir exists before we start writing anything
-        os.makedirs(os.path.join(self._reportdir, TEST_REPORTS_SUBDIR), exist_ok=True)
+        self._ensure_dir(os.path.join(self._reportdir, TEST_REPORTS_SUBDIR))
 
-        l_test_meta = self._summarize_results_product(l_qualified_product_filenames, qualified_tmp_datadir, tag)
+        return self._summarize_test_results(l_test_results, qualified_tmp_datadir, tag)
 
-        return l_test_meta
+    @log_entry_exit(logger)
+    def _read_results_tarball(self, qualified_results_tarball_filename, qualified_tmp_datadir, extract_data=True):
+        """Reads the test results products out of a tarball of them and their associated data, in a single sequential
+        pass through the tarball. The products are extracted into the provided tmpdir as they're reached, then found
+        there with `_find_product_filenames` and parsed with `_parse_products`. If `extract_data` is set, any products
+        extracted so far are parsed when a datafile is reached, so that the datafiles they reference can be extracted
+        into the tmpdir as they're passed, skipping any other files in the tarball. Products are normally stored
+        before their data, so this extracts everything needed in one pass. Any referenced datafiles which came before
+        the products referencing them are picked up in one more sequential pass.
+
+        Parameters
+        ----------
+        qualified_results_tarball_filename : str
+        qualified_tmp_datadir : str
+        extract_data : bool, default=True
+            Whether to extract the datafiles referenced by the products
+
+        Returns
+        -------
+        l_test_results : List[TestResults]
+        """
+
+        # Normalised paths, relative to the root of the tarball, of the first copy of each product, keyed by a digest
+        # of its contents. Any duplicate copies of a product are mapped to the first, so that it's only parsed once
+        d_product_filenames: Dict[bytes, str] = {}
+        d_duplicate_product_filenames: Dict[str, str] = {}
+
+        # The parsed products, keyed by their paths relative to the root of the tarball, plus the paths of the
+        # datafiles referenced by them, and of the datafiles passed over before they were known to be referenced
+        d_test_results: Dict[str, TestResults] = {}
+        s_referenced_filenames: Set[str] = set()
+        s_skipped_filenames: Set[str] = set()
+
+        # Parses any of the provided products which haven't already been parsed, noting the datafiles they reference
+        def parse_new_products(l_product_filenames):
+            l_unique_product_filenames = [d_duplicate_product_filenames.get(product_filename, product_filename)
+                                          for product_filename in l_product_filenames]
+            l_new_product_filenames = [product_filename
+                                       for product_filename in dict.fromkeys(l_unique_product_filenames)
+                                       if product_filename not in d_test_results]
+            if not l_new_product_filenames:
+                return
+            l_new_test_results = self._parse_products([os.path.join(qualified_tmp_datadir, product_filename)
+                                                       for product_filename in l_new_product_filenames])
+            d_test_results.update(zip(l_new_product_filenames, l_new_test_results))
+            s_referenced_filenames.update(self._get_referenced_data_filenames(l_new_test_results))
+
+        try:
+            with tarfile.open(qualified_results_tarball_filename, "r|*") as tf:
+                new_products_extracted = False
+                for member in tf:
+                    if not member.isfile():
+                        continue
+                    member_filename = os.path.normpath(member.name)
+                    if _is_outside_root(member_filename):
+                        logger.warning("Ignoring file %s outside of the root of tarball %s.", member_filename,
+                                       qualified_results_tarball_filename)
+                        continue
+                    if self._is_valid_product_filename(os.path.basename(member_filename)):
+                        digest = _extract_tar_member_product(tf, member,
+                                                             os.path.join(qualified_tmp_datadir, member_filename))
+                        first_product_filename = d_product_filenames.setdefault(digest, member_filename)
+                        if first_product_filename != member_filename:
+                            d_duplicate_product_filenames[member_filename] = first_product_filename
+                        new_products_extracted = True
+                        continue
+                    if not extract_data:
+                        continue
+
+                    # Parse any products reached since the last datafile, so we know which datafiles they reference.
+                    # If they're all rejected by `_find_product_filenames`, that's only an error if no products are
+                    # found by the end of the tarball, which is checked below
+                    if new_products_extracted:
+                        new_products_extracted = False
+                        try:
+                            parse_new_products(self._find_product_filenames(qualified_tmp_datadir))
+                        except ValueError:
+                            pass
+
+                    if member_filename in s_referenced_filenames:
+                        _extract_tar_member(tf, member, os.path.join(qualified_tmp_datadir, member_filename))
+                    else:
+                        s_skipped_filenames.add(member_filename)
+
+            l_product_filenames = self._find_product_filenames(qualified_tmp_datadir)
+            parse_new_products(l_product_filenames)
+
+            # If any referenced files came before the products referencing them, go back for them in a second pass
+            s_missed_filenames = s_referenced_filenames & s_skipped_filenames
+            if s_missed_filenames:
+                with tarfile.open(qualified_results_tarball_filename, "r|*") as tf:
+                    for member in tf:
+                        member_filename = os.path.normpath(member.name)
+                        if member.isfile() and member_filename in s_missed_filenames:
+                            _extract_tar_member(tf, member, os.path.join(qualified_tmp_datadir, member_filename))
+        except tarfile.TarError as e:
+            raise ValueError(f"Reading of tarball {qualified_results_tarball_filename} failed: {e}") from e
+
+        return [d_test_results[d_duplicate_product_filenames.get(product_filename, product_filename)]
+                for product_filename in l_product_filenames]
 
+    @staticmethod
     @log_entry_exit(logger)
-    def _summarize_results_product(self, l_product_filenames, qualified_tmp_datadir, tag):
-        """Writes summary markdown files for the test results contained in each of a list of data products. The
-        output will be sorted based on PointingId, and so may not be in the same order as the input list
-        `l_product_filenames`.
+    def _get_referenced_data_filenames(l_test_results):
+        """Gets the set of normalised filenames of all analysis files tarballs referenced by a list of parsed products,
+        relative to the root of the tarball they were contained in. Any filenames which would resolve to outside of
+        this are excluded.
 
         Parameters
         ----------
-        l_product_filenames : List[str]
-            List of fully-qualified filenames of data products to generate reports for.
+        l_test_results : List[TestResults]
+
+        Returns
+        -------
+        s_data_filenames : Set[str]
+        """
+
+        s_data_filenames: Set[str] = set()
+
+        for test_results in l_test_results:
+            for test_case_results in test_results.l_test_results:
+                ana_result = test_case_results.analysis_result
+                if ana_result is None:
+                    continue
+                for data_filename in (ana_result.figures_tarball, ana_result.textfiles_tarball):
+                    if data_filename is None:
+                        continue
+                    data_filename = os.path.normpath(data_filename)
+                    if _is_outside_root(data_filename):
+                        logger.warning("Ignoring reference to file %s outside of the results tarball.", data_filename)
+                        continue
+                    s_data_filenames.add(data_filename)
+
+        return s_data_filenames
+
+    @log_entry_exit(logger)
+    def _summarize_results_tarball_streaming(self,
+                                             qualified_results_tarball_filename,
+                                             qualified_tmp_datadir,
+                                             tag=None):
+        """Writes summary markdown files for the test results contained in a tarball of the test results product and
+        associated data, extracting only the products from the tarball. This is used when neither figures nor
+        textfiles are to be reported, in which case the associated data isn't needed.
+
+        Parameters
+        ----------
+        qualified_results_tarball_filename : str
+            The fully-qualified filename of a tarball containing the test results product and associated datafiles
         qualified_tmp_datadir : str
+            The fully-qualified path to a tmpdir which can be used for this test
         tag : str or None
 
         Returns
@@ -540,45 +1112,116 @@ class ReportSummaryWriter:
         l_test_meta : List[ValTestMeta]
         """
 
-        # Get a list of test results, sorted by pointing ID
-        l_test_results = [parse_xml_product(f) for f in l_product_filenames]
-        l_test_results.sort(key=lambda a: a.pnt_id)
+        return self._summarize_results_tarball_with_tmpdir(qualified_results_tarball_filename,
+                                                           qualified_tmp_datadir,
+                                                           tag=tag,
+                                                           extract_data=False)
 
-        l_test_meta: List[ValTestMeta] = []
-        for test_results in l_test_results:
+    @log_entry_exit(logger)
+    def _parse_products(self, l_product_filenames):
+        """Parses each of a list of data products. If there are multiple products, they're parsed in parallel, with a
+        pool of threads by default so that reading from disk for one can overlap with parsing of another, or with a
+        pool of processes if `parse_in_processes` is set.
 
-            test_name_tail = ""
+        Parameters
+        ----------
+        l_product_filenames : List[str]
+            List of fully-qualified filenames of data products to parse.
 
-            if tag is not None:
-                test_name_tail += f"-{tag}"
+        Returns
+        -------
+        l_test_results : List[TestResults]
+            The parsed contents of each data product, in the same order as `l_product_filenames`. If a product is
+            listed multiple times, it's only parsed once, and the same object is returned for each instance of it.
+        """
 
-            # If we're processing more than one product, ensure they're all named uniquely with their pointing ID
-            if len(l_product_filenames) > 1:
-                test_name_tail += f"-{test_results.pnt_id}"
+        l_unique_product_filenames = list(dict.fromkeys(l_product_filenames))
+        num_products = len(l_unique_product_filenames)
 
-            if self.test_name is None:
-                test_name = f"TR-{test_results.product_id}{test_name_tail}"
+        if num_products <= 1:
+            l_unique_test_results = [parse_xml_product(f) for f in l_unique_product_filenames]
+        else:
+            executor: Union[ProcessPoolExecutor, ThreadPoolExecutor]
+            if self.parse_in_processes:
+                executor = ProcessPoolExecutor(max_workers=min(MAX_PARSE_PROCESSES, num_products))
             else:
-                test_name = f"{self.test_name}{test_name_tail}"
-
-            logger.info("Building report for test %s.", test_name)
-
-            # We write the pages for the test cases first, so we know about and can link to them from the test
-            # summary page
-            l_test_case_meta = self._write_all_test_case_results(test_results=test_results,
-                                                                 test_name_tail=test_name_tail,
-                                                                 qualified_tmp_datadir=qualified_tmp_datadir)
-
-            test_filename = self._write_test_results_summary(test_results=test_results,
-                                                             test_name=test_name,
-                                                             l_test_case_meta=l_test_case_meta)
-
-            num_passed, num_failed = self._calc_num_passed_failed(l_test_case_meta)
-            l_test_meta.append(ValTestMeta(name=test_name,
-                                           filename=test_filename,
-                                           l_test_case_meta=l_test_case_meta,
-                                           num_passed=num_passed,
-                                           num_failed=num_failed))
+                executor = ThreadPoolExecutor(max_workers=min(MAX_PARSE_THREADS, num_products))
+
+            with executor:
+                l_unique_test_results = list(executor.map(parse_xml_product, l_unique_product_filenames))
+
+        if num_products == len(l_product_filenames):
+            return l_unique_test_results
+
+        d_test_results = dict(zip(l_unique_product_filenames, l_unique_test_results))
+        return [d_test_results[f] for f in l_product_filenames]
+
+    @log_entry_exit(logger)
+    def _summarize_test_results(self, l_test_results, qualified_tmp_datadir, tag):
+        """Writes summary markdown files for each of a list of parsed test results products. The output will be sorted
+        based on PointingId, and so may not be in the same order as the input list `l_test_results`.
+
+        Parameters
+        ----------
+        l_test_results : List[TestResults]
+            List of the parsed contents of data products to generate reports for.
+        qualified_tmp_datadir : str
+        tag : str or None
+
+        Returns
+        -------
+        l_test_meta : List[ValTestMeta]
+        """
+
+        l_test_results = sorted(l_test_results, key=attrgetter("pnt_id"))
+
+        # Determine the parts of the test name which are the same for all products before looping over them
+        tag_tail = f"-{tag}" if tag is not None else ""
+
+        # If we're processing more than one product, ensure they're all named uniquely with their pointing ID
+        multiple_products = len(l_test_results) > 1
+
+        test_name_head = self.test_name
+
+        l_test_meta: List[ValTestMeta] = []
+
+        # Report files are queued up while the reports are built and written out together at the end
+        try:
+            for test_results in l_test_results:
+
+                if multiple_products:
+                    test_name_tail = f"{tag_tail}-{test_results.pnt_id}"
+                else:
+                    test_name_tail = tag_tail
+
+                if test_name_head is None:
+                    test_name = f"TR-{test_results.product_id}{test_name_tail}"
+                else:
+                    test_name = f"{test_name_head}{test_name_tail}"
+
+                logger.info("Building report for test %s.", test_name)
+
+                # We write the pages for the test cases first, so we know about and can link to them from the test
+                # summary page
+                l_test_case_meta = self._write_all_test_case_results(test_results=test_results,
+                                                                     test_name_tail=test_name_tail,
+                                                                     qualified_tmp_datadir=qualified_tmp_datadir)
+
+                test_filename = self._write_test_results_summary(test_results=test_results,
+                                                                 test_name=test_name,
+                                                                 l_test_case_meta=l_test_case_meta)
+
+                num_passed, num_failed = self._calc_num_passed_failed(l_test_case_meta)
+                l_test_meta.append(ValTestMeta(name=test_name,
+                                               filename=test_filename,
+                                               l_test_case_meta=l_test_case_meta,
+                                               num_passed=num_passed,
+                                               num_failed=num_failed))
+        finally:
+            self._flush_pending_writes()
+            self._clear_extracted_tarballs()
+            self._d_data_filenames = {}
+
         return l_test_meta
 
     @staticmethod
@@ -596,7 +1239,9 @@ class ReportSummaryWriter:
         num_failed : int
         """
 
-        num_passed = sum([1 for x in l_test_case_meta if x.passed])
+        # `passed` may be None if unknown, which is counted as not passing. `countOf` counts the matches without
+        # building an intermediate list
+        num_passed = countOf(map(attrgetter("passed"), l_test_case_meta), True)
         num_failed = len(l_test_case_meta) - num_passed
 
         return num_passed, num_failed
@@ -615,7 +1260,7 @@ class ReportSummaryWriter:
         l_product_filenames : List[str]
         """
 
-        l_product_filenames = self._recursive_find_product_filenames(qualified_tmpdir)
+        l_product_filenames = self._search_product_filenames(qualified_tmpdir)
 
         if len(l_product_filenames) == 0:
             raise ValueError("No .xml data products found in tarball.")
@@ -623,21 +1268,29 @@ class ReportSummaryWriter:
         return l_product_filenames
 
     @log_entry_exit(logger)
-    def _recursive_find_product_filenames(self, qualified_dir: str) -> List[str]:
-        """Recursive implementation of core loop in finding product filenames, to search within all subdirs.
+    def _search_product_filenames(self, qualified_dir: str) -> List[str]:
+        """Core loop in finding product filenames, which searches breadth-first within the directory and all its
+        subdirs, returning the filenames relative to `qualified_dir`.
         """
 
-        l_product_filenames = [fn for fn in os.listdir(qualified_dir) if
-                               os.path.isfile(os.path.join(qualified_dir, fn)) and self._is_valid_product_filename(fn)]
+        l_product_filenames: List[str] = []
+
+        is_valid_product_filename = self._is_valid_product_filename
 
-        l_subdirs = [subdir for subdir in os.listdir(qualified_dir) if
-                     os.path.isdir(os.path.join(qualified_dir, subdir))]
+        # Queue of (fully-qualified, relative) paths to directories to search. Relative paths are stored with a
+        # trailing "/" (except at the top level, where they're empty), so that paths within them can be formatted
+        # directly
+        q_dirs: Deque[Tuple[str, str]] = deque([(qualified_dir, "")])
 
-        # Search recursively in each subdir
-        for subdir in l_subdirs:
-            qualified_subdir = os.path.join(qualified_dir, subdir)
-            l_product_filenames += [os.path.join(subdir, fn) for fn in
-                                    self._recursive_find_product_filenames(qualified_subdir)]
+        while q_dirs:
+            qualified_subdir, subdir_prefix = q_dirs.popleft()
+            with os.scandir(qualified_subdir) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        q_dirs.append((entry.path, f"{subdir_prefix}{name}/"))
+                    elif entry.is_file() and is_valid_product_filename(name):
+                        l_product_filenames.append(f"{subdir_prefix}{name}")
 
         return l_product_filenames
 
@@ -679,21 +1332,34 @@ class ReportSummaryWriter:
 
         l_test_case_names = self._get_l_test_case_names(test_results, test_name_tail)
 
-        l_test_case_names_and_filenames: List[ValTestCaseMeta] = []
-        for test_case_results, test_case_name in zip(test_results.l_test_results, l_test_case_names):
-            test_case_filename = os.path.join(TEST_REPORTS_SUBDIR, f"{test_case_name}.md")
-
-            l_test_case_names_and_filenames.append(ValTestCaseMeta(name=test_case_name,
-                                                                   filename=test_case_filename,
-                                                                   passed=(test_case_results.global_result ==
-                                                                           "PASSED")))
-
-            # Now we defer to a sub-method to write the results, so the formatting in that bit can be easily overridden
+        # Built with a comprehension rather than repeated method calls to `append`
+        l_test_case_names_and_filenames: List[ValTestCaseMeta] = [
+            ValTestCaseMeta(name=test_case_name,
+                            filename=f"{TEST_REPORTS_PREFIX}{test_case_name}.md",
+                            passed=(test_case_results.global_result == "PASSED"))
+            for test_case_results, test_case_name in zip(test_results.l_test_results, l_test_case_names)]
+
+        # Now we defer to a sub-method to write the results, so the formatting in that bit can be easily overridden.
+        # Each test case is independent, so we write them with a pool of threads, allowing the extraction and moving
+        # of files for each to overlap
+        def write_test_case(test_case_results_and_meta):
+            test_case_results, test_case_meta = test_case_results_and_meta
             self._write_individual_test_case_results(test_case_results=test_case_results,
-                                                     test_case_name=test_case_name,
-                                                     test_case_filename=test_case_filename,
+                                                     test_case_name=test_case_meta.name,
+                                                     test_case_filename=test_case_meta.filename,
                                                      qualified_tmp_datadir=qualified_tmp_datadir)
 
+        l_test_case_results_and_meta = list(zip(test_results.l_test_results, l_test_case_names_and_filenames))
+
+        if len(l_test_case_results_and_meta) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_TEST_CASE_THREADS,
+                                                    len(l_test_case_results_and_meta))) as executor:
+                # Consume the iterator so that any exceptions raised in the threads are raised here
+                list(executor.map(write_test_case, l_test_case_results_and_meta))
+        else:
+            for test_case_results_and_meta in l_test_case_results_and_meta:
+                write_test_case(test_case_results_and_meta)
+
         return l_test_case_names_and_filenames
 
     @staticmethod
@@ -704,22 +1370,9 @@ class ReportSummaryWriter:
         the name, and in the case of clashes, appends an index to the name, e.g. "ID", "ID-2", "ID-3", etc.
         """
 
-        d_test_name_instances: Dict[str, int] = {}
-        l_test_case_names: List[str] = []
+        t_test_case_ids = tuple(test_case_results.test_id for test_case_results in test_results.l_test_results)
 
-        for test_case_results in test_results.l_test_results:
-
-            test_case_id = test_case_results.test_id
-            if test_case_id in d_test_name_instances:
-                d_test_name_instances[test_case_id] += 1
-                test_case_name = f"{test_case_id}-{d_test_name_instances[test_case_id]}{test_name_tail}"
-            else:
-                d_test_name_instances[test_case_id] = 1
-                test_case_name = f"{test_case_id}{test_name_tail}"
-
-            l_test_case_names.append(test_case_name)
-
-        return l_test_case_names
+        return list(get_unique_test_case_names(t_test_case_ids, test_name_tail))
 
     @log_entry_exit(logger)
     def _write_individual_test_case_results(self,
@@ -743,12 +1396,16 @@ class ReportSummaryWriter:
         qualified_tmp_datadir : str
         """
 
-        qualified_test_case_filename = os.path.join(self._reportdir, test_case_filename)
+        qualified_test_case_filename = f"{self._reportdir_prefix}{test_case_filename}"
 
-        logger.info("Writing results for test case %s from %s.", test_case_name, qualified_test_case_filename)
+        if self.skip_unchanged and self._is_test_case_report_up_to_date(qualified_test_case_filename,
+                                                                        test_case_results,
+                                                                        qualified_tmp_datadir):
+            logger.info("Report for test case %s at %s is up-to-date; skipping.", test_case_name,
+                        qualified_test_case_filename)
+            return
 
-        # Ensure the folder for this exists
-        os.makedirs(os.path.split(qualified_test_case_filename)[0], exist_ok=True)
+        logger.info("Writing results for test case %s from %s.", test_case_name, qualified_test_case_filename)
 
         writer = TocMarkdownWriter(test_case_name)
 
@@ -756,8 +1413,46 @@ class ReportSummaryWriter:
 
         self._add_test_case_details_and_figures(test_case_results, writer, qualified_tmp_datadir)
 
-        with open(qualified_test_case_filename, "w") as fo:
-            writer.write(fo)
+        self._queue_write(qualified_test_case_filename, writer)
+
+    @log_entry_exit(logger)
+    def _is_test_case_report_up_to_date(self, qualified_test_case_filename, test_case_results, qualified_tmp_datadir):
+        """Checks if the report for a test case already exists and is newer than all the files it would be built from,
+        i.e. the results file, plus the analysis files tarballs if figures or textfiles are reported on.
+
+        Parameters
+        ----------
+        qualified_test_case_filename : str
+            The fully-qualified filename of the report for this test case
+        test_case_results : SingleTestResult
+        qualified_tmp_datadir : str
+
+        Returns
+        -------
+        bool
+        """
+
+        try:
+            report_mtime_ns = os.stat(qualified_test_case_filename).st_mtime_ns
+        except FileNotFoundError:
+            return False
+
+        source_mtime_ns = self._results_mtime_ns
+
+        # The analysis files tarballs are only used if figures or textfiles are reported on, and otherwise won't have
+        # been extracted
+        if not (self.has_figures or self.has_textfiles):
+            return report_mtime_ns > source_mtime_ns
+
+        ana_result = test_case_results.analysis_result
+        for ana_files_tarball in (ana_result.figures_tarball, ana_result.textfiles_tarball):
+            if ana_files_tarball is None:
+                continue
+            qualified_ana_files_tarball = self._get_data_filename(ana_files_tarball, qualified_tmp_datadir)
+            if qualified_ana_files_tarball is not None:
+                source_mtime_ns = max(source_mtime_ns, os.stat(qualified_ana_files_tarball).st_mtime_ns)
+
+        return report_mtime_ns > source_mtime_ns
 
     @staticmethod
     @log_entry_exit(logger)
@@ -772,11 +1467,20 @@ class ReportSummaryWriter:
         """
 
         writer.add_heading(HEADING_GENERAL_INFO, depth=0)
-        writer.add_line(f"**Test Case ID:** {test_case_results.test_id}\n\n")
-        writer.add_line(f"**Description:** {test_case_results.test_description}\n\n")
-        writer.add_line(f"**Result:** {test_case_results.global_result}\n\n")
-        if test_case_results.analysis_result.ana_comment is not None:
-            writer.add_line(f"**Comments:** {test_case_results.analysis_result.ana_comment}\n\n")
+
+        # Dereference the attributes we need once up front
+        test_id, test_description, global_result = (test_case_results.test_id,
+                                                    test_case_results.test_description,
+                                                    test_case_results.global_result)
+        ana_comment = test_case_results.analysis_result.ana_comment
+
+        # Build up the full block of metadata and add it to the writer at once
+        meta_block = (f"**Test Case ID:** {test_id}\n\n"
+                      f"**Description:** {test_description}\n\n"
+                      f"**Result:** {global_result}\n\n")
+        if ana_comment is not None:
+            meta_block += f"**Comments:** {ana_comment}\n\n"
+        writer.add_line(meta_block)
 
     @log_entry_exit(logger)
     def _add_test_case_details_and_figures(self, test_case_results, writer, qualified_tmp_datadir):
@@ -792,13 +1496,13 @@ class ReportSummaryWriter:
 
         # Make a new dir within the existing datadir for this batch of figures and textfiles (to avoid name clashes
         # with other test cases)
-        ana_files_tmpdir = self._make_tmpdir(test_case_results, qualified_tmp_datadir)
+        ana_files_tmpdir = self._make_tmpdir(qualified_tmp_datadir)
 
         try:
             self._add_test_case_details_and_figures_with_tmpdir(writer, test_case_results, qualified_tmp_datadir,
                                                                 ana_files_tmpdir)
         finally:
-            shutil.rmtree(ana_files_tmpdir)
+            self._remove_tmpdir(ana_files_tmpdir)
 
     @log_entry_exit(logger)
     def _add_test_case_details_and_figures_with_tmpdir(self, writer, test_case_results, qualified_tmp_datadir,
@@ -828,9 +1532,13 @@ class ReportSummaryWriter:
 
         ana_result = test_case_results.analysis_result
 
-        l_ana_files_labels_and_filenames = self._prepare_ana_files(ana_result=ana_result,
-                                                                   qualified_tmp_datadir=qualified_tmp_datadir,
-                                                                   ana_files_tmpdir=ana_files_tmpdir)
+        # Only bother unpacking the analysis files if we'll be reporting on any of them
+        if self.has_figures or self.has_textfiles:
+            l_ana_files_labels_and_filenames = self._prepare_ana_files(ana_result=ana_result,
+                                                                       qualified_tmp_datadir=qualified_tmp_datadir,
+                                                                       ana_files_tmpdir=ana_files_tmpdir)
+        else:
+            l_ana_files_labels_and_filenames = None
 
         self._add_test_case_figures(writer=writer,
                                     ana_files_tmpdir=ana_files_tmpdir,
@@ -852,13 +1560,22 @@ class ReportSummaryWriter:
         # We can't guarantee that supplementary info keys will be unique between different requirements,
         # so to ensure we have unique links for each, we keep a counter and add it to the name of each
         writer.add_heading(HEADING_DETAILED_RESULTS, depth=0)
-        for req_i, req in enumerate(test_case_results.l_requirements):
-            writer.add_heading("Requirement", depth=1)
-            self._add_measured_parameter_line(writer, req)
-            self._add_measured_value_line(writer, req)
-            if req.req_comment is not None:
-                writer.add_line(f"**Comments**: {req.req_comment}\n\n")
-            self._add_test_case_supp_info(writer, req)
+
+        # Bind the methods called for each requirement to locals, to avoid looking them up each iteration
+        add_heading = writer.add_heading
+        add_line = writer.add_line
+        add_measured_parameter_line = self._add_measured_parameter_line
+        add_measured_value_line = self._add_measured_value_line
+        add_test_case_supp_info = self._add_test_case_supp_info
+
+        for req in test_case_results.l_requirements:
+            add_heading("Requirement", depth=1)
+            add_measured_parameter_line(writer, req)
+            add_measured_value_line(writer, req)
+            req_comment = req.req_comment
+            if req_comment is not None:
+                add_line(f"**Comments**: {req_comment}\n\n")
+            add_test_case_supp_info(writer, req)
 
     @staticmethod
     @log_entry_exit(logger)
@@ -897,17 +1614,19 @@ class ReportSummaryWriter:
         req : RequirementResults
         """
 
-        for supp_info_i, supp_info in enumerate(req.l_supp_info):
-            writer.add_heading(f"{supp_info.info_key}", depth=2)
-            writer.add_line(f"{supp_info.info_description}\n\n")
-            writer.add_line("```\n")
+        add_heading = writer.add_heading
+        add_line = writer.add_line
+
+        for supp_info in req.l_supp_info:
+            add_heading(f"{supp_info.info_key}", depth=2)
 
             # Trim excess line breaks from the supplementary info's beginning and end
             supp_info_str = supp_info.info_value.strip()
 
-            writer.add_line(supp_info_str)
-
-            writer.add_line("\n```\n\n")
+            add_line(f"{supp_info.info_description}\n\n"
+                     "```\n"
+                     f"{supp_info_str}\n"
+                     "```\n\n")
 
     @log_entry_exit(logger)
     def _prepare_ana_files(self, ana_result, qualified_tmp_datadir, ana_files_tmpdir):
@@ -936,39 +1655,94 @@ class ReportSummaryWriter:
             return None
 
         # Extract the textfiles and figures tarballs
-        qualified_textfiles_tarball_filename = get_data_filename(ana_result.textfiles_tarball, qualified_tmp_datadir)
-        qualified_figures_tarball_filename = get_data_filename(ana_result.figures_tarball, qualified_tmp_datadir)
+        qualified_textfiles_tarball_filename = self._get_data_filename(ana_result.textfiles_tarball,
+                                                                       qualified_tmp_datadir)
+        qualified_figures_tarball_filename = self._get_data_filename(ana_result.figures_tarball,
+                                                                     qualified_tmp_datadir)
 
         # Return None if either expected tarball doesn't exist
         if qualified_textfiles_tarball_filename is None or qualified_figures_tarball_filename is None:
             return None
 
         try:
-            extract_tarball(qualified_figures_tarball_filename, ana_files_tmpdir)
+            l_figures_filenames = self._extract_tarball_cached(qualified_figures_tarball_filename, ana_files_tmpdir)
         except ValueError:
             logger.error(MSG_TARBALL_CORRUPT, qualified_figures_tarball_filename)
             return None
         try:
-            extract_tarball(qualified_textfiles_tarball_filename, ana_files_tmpdir)
+            l_textfiles_filenames = self._extract_tarball_cached(qualified_textfiles_tarball_filename,
+                                                                 ana_files_tmpdir)
         except ValueError:
             logger.error(MSG_TARBALL_CORRUPT, qualified_textfiles_tarball_filename)
             return None
 
         # Find the "directory" file which should have been in the tarball, and get the labels and filenames of
-        # figures from it
+        # figures from it. We already know what files were extracted, so we don't need to scan the tmpdir for it
         try:
-            qualified_directory_filename = self.find_directory_filename(ana_files_tmpdir)
+            qualified_directory_filename = self.find_directory_filename(ana_files_tmpdir,
+                                                                        [*l_figures_filenames, *l_textfiles_filenames])
         except (FileNotFoundError, ValueError) as e:
-            logger.error(str(e) + " This occurred when unpacking tarball %s", qualified_textfiles_tarball_filename)
+            logger.error("%s This occurred when unpacking tarball %s", e, qualified_textfiles_tarball_filename)
             return None
 
         l_ana_files_labels_and_filenames = self.read_ana_files_labels_and_filenames(qualified_directory_filename)
 
         # Make sure a data subdir exists in the images dir
-        os.makedirs(os.path.join(self._reportdir, IMAGES_SUBDIR, DATA_DIR), exist_ok=True)
+        self._ensure_dir(f"{self._qualified_images_prefix}{DATA_DIR}")
 
         return l_ana_files_labels_and_filenames
 
+    @log_entry_exit(logger)
+    def _extract_tarball_cached(self, qualified_tarball_filename, ana_files_tmpdir):
+        """Extracts the contents of a tarball into a tmpdir. The tarball is only actually extracted the first time
+        this is called for it, into a separate directory, and its contents are linked from there into the tmpdir
+        provided. This avoids repeated extraction of tarballs shared between test cases.
+
+        Parameters
+        ----------
+        qualified_tarball_filename : str
+            The fully-qualified filename of the tarball
+        ana_files_tmpdir : str
+            The fully-qualified path to the tmpdir to make the contents of the tarball available in
+
+        Returns
+        -------
+        l_top_level_filenames : List[str]
+            The names of all files at the top level of the tarball
+        """
+
+        tarball_stat = os.stat(qualified_tarball_filename)
+        key = (qualified_tarball_filename, tarball_stat.st_mtime_ns, tarball_stat.st_size)
+
+        # Test cases may be processed in parallel, so we hold a lock specific to this tarball while checking for and
+        # extracting it, so that it's only extracted once
+        with self._extracted_tarballs_lock:
+            key_lock = self._d_extracted_tarball_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            qualified_extracted_dir = self._d_extracted_tarball_dirs.get(key)
+            if qualified_extracted_dir is None:
+                qualified_extracted_dir = self._make_tmpdir(os.path.dirname(ana_files_tmpdir))
+                try:
+                    extract_tarball(qualified_tarball_filename, qualified_extracted_dir)
+                except Exception:
+                    shutil.rmtree(qualified_extracted_dir)
+                    raise
+                self._d_extracted_tarball_dirs[key] = qualified_extracted_dir
+
+        return _link_tree(qualified_extracted_dir, ana_files_tmpdir)
+
+    @log_entry_exit(logger)
+    def _clear_extracted_tarballs(self):
+        """Removes all directories which tarballs have been extracted into by `_extract_tarball_cached`.
+        """
+
+        with self._extracted_tarballs_lock:
+            for qualified_extracted_dir in self._d_extracted_tarball_dirs.values():
+                self._remove_tmpdir(qualified_extracted_dir)
+            self._d_extracted_tarball_dirs = {}
+            self._d_extracted_tarball_locks = {}
+
     @log_entry_exit(logger)
     def _add_test_case_figures(self, writer, ana_files_tmpdir, l_ana_files_labels_and_filenames):
         """Prepares figures and adds lines for them to a MarkdownWriter, after a new temporary directory has been
@@ -995,31 +1769,47 @@ class ReportSummaryWriter:
             writer.add_line(f"{MSG_NA}\n\n")
             return
 
-        some_figures_added = False
+        l_indexed_figures = _get_l_indexed_ana_files(l_ana_files_labels_and_filenames, is_figure=True)
 
-        # Add a subsection for each figure to the writer
-        for i, file_info in enumerate(l_ana_files_labels_and_filenames):
+        # Move all the figures to the public directory in one batch before writing anything about them
+        l_relative_figure_filenames = self._move_figures_to_public([file_info.filename for _, file_info in
+                                                                    l_indexed_figures], ana_files_tmpdir)
 
-            if not file_info.is_figure:
-                continue
-            else:
-                some_figures_added = True
+        # Add a subsection for each figure to the writer
+        for (i, file_info), relative_figure_filename in zip(l_indexed_figures, l_relative_figure_filenames):
 
             # Make a label if we don't have one
             label = file_info.label
             if label is None:
-                label = HEADING_FIGURE_N % i
-
-            relative_figure_filename = self._move_figure_to_public(file_info.filename, ana_files_tmpdir)
+                label = _get_figure_heading(i)
 
             writer.add_heading(label, depth=1)
             writer.add_line(f"![{label}]({relative_figure_filename})\n\n")
 
         # Check if we output any figures, and output N/A if not
-        if not some_figures_added:
+        if not l_indexed_figures:
             writer.add_line(f"{MSG_NA}\n\n")
             return
 
+    @log_entry_exit(logger)
+    def _move_figures_to_public(self, l_filenames, ana_files_tmpdir):
+        """Move a batch of figures to the appropriate directory and return the relative filenames for them.
+
+        Parameters
+        ----------
+        l_filenames : Sequence[str]
+            The filenames of the figures relative to the `ana_files_tmpdir`
+        ana_files_tmpdir : str
+            The fully-qualified path to the tmpdir created to store unpacked figures.
+
+        Returns
+        -------
+        l_relative_figure_filenames : List[str or None]
+            The paths to the moved figures relative to where test reports are stored, in the same order as
+            `l_filenames`. See `_move_figure_to_public` for details.
+        """
+        return [self._move_figure_to_public(filename, ana_files_tmpdir) for filename in l_filenames]
+
     @log_entry_exit(logger)
     def _move_figure_to_public(self, filename, ana_files_tmpdir):
         """Move a figure to the appropriate directory and return the relative filename for it.
@@ -1038,22 +1828,25 @@ class ReportSummaryWriter:
             file wasn't present, the error will be logged and None will be returned instead.
         """
 
-        qualified_src_filename = os.path.join(ana_files_tmpdir, filename)
-        qualified_dest_filename = os.path.join(self._reportdir, IMAGES_SUBDIR, filename)
+        qualified_src_filename = f"{ana_files_tmpdir}/{filename}"
+        qualified_dest_filename = f"{self._qualified_images_prefix}{filename}"
 
-        # Check for file existence
-        if not os.path.isfile(qualified_src_filename):
+        # Try to move the file, and only check for existence if this fails
+        try:
+            os.replace(qualified_src_filename, qualified_dest_filename)
+        except FileNotFoundError:
             # Source doesn't exist. If destination does, then there's no issue - presumably it's already been moved
             # for another page, and so we don't need to move it again. If destination doesn't exist, then we have an
             # error.
             if not os.path.isfile(qualified_dest_filename):
-                logger.error(f"Expected figure {filename} does not exist.")
+                logger.error("Expected figure %s does not exist.", filename)
                 return None
-        else:
+        except OSError:
+            # Most likely the report directory is on a different filesystem, so fall back to copying the file over
             shutil.move(qualified_src_filename, qualified_dest_filename)
 
         # Return the path to the moved figure file, relative to where test reports will be stored
-        return f"../{IMAGES_SUBDIR}/{filename}"
+        return f"{RELATIVE_IMAGES_DIR}{filename}"
 
     @log_entry_exit(logger)
     def _add_test_case_textfiles(self, writer, ana_files_tmpdir, l_ana_files_labels_and_filenames):
@@ -1079,35 +1872,39 @@ class ReportSummaryWriter:
             writer.add_line(f"{MSG_NA}\n\n")
             return
 
-        some_textfiles_added = False
+        l_indexed_textfiles = _get_l_indexed_ana_files(l_ana_files_labels_and_filenames, is_figure=False)
 
         # Add a subsection for each textfile to the writer
-        for i, file_info in enumerate(l_ana_files_labels_and_filenames):
-
-            if file_info.is_figure:
-                continue
-            else:
-                some_textfiles_added = True
+        for i, file_info in l_indexed_textfiles:
 
             # Make a label if we don't have one
             label = file_info.label
             if label is None:
-                label = HEADING_TEXTFILE_N % i
+                label = _get_textfile_heading(i)
 
             writer.add_heading(label, depth=1)
 
             qualified_filename = os.path.join(ana_files_tmpdir, file_info.filename)
 
-            # Check if the file contains a table, and print it neatly if so
-            try:
-                table = Table.read(qualified_filename)
+            # Check if the file contains a table in a single identifiable format, and print it neatly if so. The
+            # file is opened so that its contents can be checked, and not just its extension
+            with open(qualified_filename, "rb") as fi:
+                l_table_formats = identify_format("read", Table, qualified_filename, fi, [], {})
+            table: Optional[Table] = None
+            if len(l_table_formats) == 1:
+                try:
+                    table = Table.read(qualified_filename, format=l_table_formats[0])
+                except IORegistryError:
+                    pass
+
+            if table is not None:
                 self._add_table_contents(writer=writer, table=table)
-            except IORegistryError:
+            else:
                 # Fall back to printing raw contents of the file
                 self._add_raw_textfile_contents(writer=writer, qualified_filename=qualified_filename)
 
         # Check if we output any textfiles, and output N/A if not
-        if not some_textfiles_added:
+        if not l_indexed_textfiles:
             writer.add_line(f"{MSG_NA}\n\n")
             return
 
@@ -1124,12 +1921,10 @@ class ReportSummaryWriter:
             An astropy table, which is to be printed out cleanly in the markdown writer
         """
 
-        if self._output_format == OutputFormat.HTML:
+        if self._is_html:
             self._add_table_contents_html(writer, table)
-        elif self._output_format == OutputFormat.MD:
-            self._add_table_contents_md(writer, table)
         else:
-            raise ValueError(f"Unrecognized output format: {self._output_format=}")
+            self._add_table_contents_md(writer, table)
 
     @staticmethod
     @log_entry_exit(logger)
@@ -1142,43 +1937,29 @@ class ReportSummaryWriter:
         table : Table
         """
 
-        # Put the table in a scrollable div container
-        writer.add_line("<div class=\"tableContainer\">\n<table>\n")
-
-        # Add the table header
-
-        writer.add_line("<tr>\n")
-        for colname in table.colnames:
-            writer.add_line(f"<th><strong>{colname}</strong></th>\n")
-        writer.add_line("</tr>\n")
+        # Build up the full table as a list of strings, and add it to the writer all at once at the end
 
-        # Start the table body
-        writer.add_line("<tbody>\n")
+        # Put the table in a scrollable div container, and add the table header
+        l_table_lines = ["<div class=\"tableContainer\">\n<table>\n",
+                         "<tr>\n",
+                         *[f"<th><strong>{colname}</strong></th>\n" for colname in table.colnames],
+                         "</tr>\n",
+                         "<tbody>\n"]
 
-        # Add data for each row
-        hit_row_limit = False
-        for row_index, row in enumerate(table):
-
-            if row_index >= HTML_TABLE_LINE_LIMIT:
-                hit_row_limit = True
-                break
-
-            writer.add_line("<tr>\n")
-
-            # Add each item in the row
-            for item in row:
-                # Convert each item into a string, and remove any linebreaks in that string
-                cleaned_item = str(item).replace("\n", "")
-                writer.add_line(f"<td>{cleaned_item}</td>\n")
-
-            writer.add_line("</tr>\n")
+        # Add data for each row, up to the limit, converting each item into a string with any linebreaks removed. Each
+        # row is formatted with a single template, so that only one string is added to the list per row
+        row_template = "<tr>\n" + "<td>%s</td>\n" * len(table.colnames) + "</tr>\n"
+        l_table_lines += [row_template % tuple(l_row_items)
+                          for l_row_items in _get_l_table_row_strs(table, HTML_TABLE_LINE_LIMIT)]
 
         # Close the table body, table, and div
-        writer.add_line("</tbody>\n</table>\n</div>\n\n")
+        l_table_lines.append("</tbody>\n</table>\n</div>\n\n")
 
         # If we hit the row limit, make a note of this
-        if hit_row_limit:
-            writer.add_line(f"{MSG_HTML_TABLE_LIMIT}\n\n")
+        if len(table) > HTML_TABLE_LINE_LIMIT:
+            l_table_lines.append(f"{MSG_HTML_TABLE_LIMIT}\n\n")
+
+        writer.add_line("".join(l_table_lines))
 
     @staticmethod
     @log_entry_exit(logger)
@@ -1191,35 +1972,30 @@ class ReportSummaryWriter:
         table : Table
         """
 
+        # Build up the full table as a list of strings, and add it to the writer all at once at the end
+
         # Add a header row with the column names, then a separator line below it
 
         num_columns = len(table.colnames)
 
-        writer.add_line((("| **%s** " * num_columns) + "|\n") % tuple(table.colnames))
-        writer.add_line("|:--" * num_columns + "|\n")
-
-        # Add data for each row
+        l_table_lines = [(("| **%s** " * num_columns) + "|\n") % tuple(table.colnames),
+                         "|:--" * num_columns + "|\n"]
 
-        row_line_template = ("| %s " * num_columns) + "|"
-        hit_row_limit = False
+        # Add data for each row, up to the limit, with each item cleaned of any newlines within it
 
-        for row_index, row in enumerate(table):
+        row_line_template = ("| %s " * num_columns) + "|\n"
 
-            if row_index >= MD_TABLE_LINE_LIMIT:
-                hit_row_limit = True
-                break
-            row_line = row_line_template % tuple(map(str, row))
-
-            # Clean the line of any newlines and add it to the writer
-            row_line_cleaned = row_line.replace("\n", "")
-            writer.add_line(f"{row_line_cleaned}\n")
+        l_table_lines += [row_line_template % l_row_items
+                          for l_row_items in _get_l_table_row_strs(table, MD_TABLE_LINE_LIMIT)]
 
         # Add an extra linebreak after the table
-        writer.add_line("\n")
+        l_table_lines.append("\n")
 
         # If we hit the row limit, make a note of this
-        if hit_row_limit:
-            writer.add_line(f"{MSG_MD_TABLE_LIMIT}\n\n")
+        if len(table) > MD_TABLE_LINE_LIMIT:
+            l_table_lines.append(f"{MSG_MD_TABLE_LIMIT}\n\n")
+
+        writer.add_line("".join(l_table_lines))
 
     @staticmethod
     @log_entry_exit(logger)
@@ -1233,36 +2009,48 @@ class ReportSummaryWriter:
             The fully-qualified filename of the textfile
         """
         # Read in the textfile in and write out its contents in a math section to avoid formatting issues
-        writer.add_line("```\n")
-        for line_index, line in enumerate(open(qualified_filename, "r")):
-            if line_index >= TEXTFILE_LINE_LIMIT:
-                writer.add_line(f"{MSG_TEXTFILE_LIMIT}\n")
-                break
-            # Lines read in this way already include a linebreak at the end, so we don't need to add one in
-            writer.add_line(line)
-        writer.add_line("```\n\n")
+        # Read one more line than the limit, so we can tell if the limit was hit
+        with open(qualified_filename, "r") as fi:
+            l_lines = list(islice(fi, TEXTFILE_LINE_LIMIT + 1))
+
+        if len(l_lines) > TEXTFILE_LINE_LIMIT:
+            l_lines[-1] = f"{MSG_TEXTFILE_LIMIT}\n"
+
+        # Lines read in this way already include a linebreak at the end, so we don't need to add one in
+        writer.add_line("```\n" + "".join(l_lines) + "```\n\n")
 
     @staticmethod
     @log_entry_exit(logger)
-    def find_directory_filename(ana_files_tmpdir):
+    def find_directory_filename(ana_files_tmpdir, l_filenames=None):
         """Searches through a directory to find a possible directory file (which contains labels and filenames of
         figures).
 
         Parameters
         ----------
         ana_files_tmpdir : str
+        l_filenames : Iterable[str] or None, default=None
+            If provided, the names of the files in the directory, which will be searched through instead of scanning
+            the directory itself.
 
         Returns
         -------
         qualified_directory_filename : str
         """
 
-        l_filenames = os.listdir(ana_files_tmpdir)
-
-        l_possible_directory_filenames: List[str] = []
-        for filename in l_filenames:
-            if filename.endswith(DIRECTORY_FILE_EXT):
-                l_possible_directory_filenames.append(filename)
+        l_possible_directory_filenames: List[str]
+        if l_filenames is not None:
+            # Remove any duplicates, which could occur if the same file was extracted from multiple tarballs
+            l_possible_directory_filenames = [filename for filename in dict.fromkeys(l_filenames)
+                                              if filename.endswith(DIRECTORY_FILE_EXT)]
+        else:
+            # Scan for candidate files, stopping early once we know there's more than one
+            l_possible_directory_filenames = []
+            with os.scandir(ana_files_tmpdir) as it:
+                for entry in it:
+                    if entry.name.endswith(DIRECTORY_FILE_EXT) and entry.is_file():
+                        l_possible_directory_filenames.append(entry.name)
+                        if len(l_possible_directory_filenames) > 1:
+                            break
 
         # Check we have exactly one possibility, otherwise raise an exception
         if len(l_possible_directory_filenames) == 1:
@@ -1291,40 +2079,36 @@ class ReportSummaryWriter:
         l_ana_files_labels_and_filenames: List[FileInfo] or None
         """
 
-        # Use the directory to find labels for figures, if it has them. Otherwise, just use it as a list of the figures
-        with open(qualified_directory_filename, "r") as fi:
-            l_directory_lines = fi.readlines()
-
-        l_ana_files_labels_and_filenames: List[Tuple[Optional[str], str, bool]] = []
+        l_ana_files_labels_and_filenames: List[FileInfo] = []
         textfiles_section_started = False
         figures_section_started = False
-        for directory_line in l_directory_lines:
-            directory_line = directory_line.strip()
-
-            # If we haven't started the textfiles section, check for the header which starts it and then start reading
-            # on the next iteration
-            if not textfiles_section_started:
-                if directory_line == DIRECTORY_FILE_TEXTFILES_HEADER:
-                    textfiles_section_started = True
-                    figures_section_started = False
-                continue
-            if not figures_section_started:
-                if directory_line == DIRECTORY_FILE_FIGURES_HEADER:
+
+        # Use the directory to find labels for figures, if it has them. Otherwise, just use it as a list of the figures.
+        # We read through the file line-by-line in a single pass
+        with open(qualified_directory_filename, "r") as fi:
+            for directory_line in fi:
+                directory_line = directory_line.strip()
+
+                # If we haven't started the textfiles section, check for the header which starts it and then start
+                # reading on the next iteration
+                if not textfiles_section_started:
+                    if directory_line == DIRECTORY_FILE_TEXTFILES_HEADER:
+                        textfiles_section_started = True
+                    continue
+                if not figures_section_started and directory_line == DIRECTORY_FILE_FIGURES_HEADER:
                     figures_section_started = True
                     continue
 
-            # If we get here, we're in the figures section
-            figure_label: Optional[str] = None
-            figure_filename: str
-            if DIRECTORY_FILE_SEPARATOR in directory_line:
-                figure_label, figure_filename = directory_line.split(DIRECTORY_FILE_SEPARATOR)
-            else:
-                figure_filename = directory_line
+                # If we get here, we're in the textfiles or figures section
+                figure_label: Optional[str]
+                figure_label, separator, figure_filename = directory_line.partition(DIRECTORY_FILE_SEPARATOR)
+                if not separator:
+                    figure_label, figure_filename = None, directory_line
 
-            if figure_filename is not None and figure_filename != "None":
-                l_ana_files_labels_and_filenames.append(FileInfo(label=figure_label,
-                                                                 filename=figure_filename,
-                                                                 is_figure=figures_section_started))
+                if figure_filename != "None":
+                    l_ana_files_labels_and_filenames.append(FileInfo(label=figure_label,
+                                                                     filename=figure_filename,
+                                                                     is_figure=figures_section_started))
 
         return l_ana_files_labels_and_filenames
 
@@ -1348,9 +2132,9 @@ class ReportSummaryWriter:
             within `rootdir`
         """
 
-        test_filename = os.path.join(TEST_REPORTS_SUBDIR, f"{test_name}.md")
+        test_filename = f"{TEST_REPORTS_PREFIX}{test_name}.md"
 
-        qualified_test_filename = os.path.join(self._reportdir, test_filename)
+        qualified_test_filename = f"{self._reportdir_prefix}{test_filename}"
 
         logger.info("Writing test results summary to %s", qualified_test_filename)
 
@@ -1360,11 +2144,7 @@ class ReportSummaryWriter:
         self._add_test_metadata(writer, test_results)
         self._add_test_case_table(writer, test_results, l_test_case_meta)
 
-        # Ensure the folder for this exists
-        os.makedirs(os.path.split(qualified_test_filename)[0], exist_ok=True)
-
-        with open(qualified_test_filename, "w") as fo:
-            writer.write(fo)
+        self._queue_write(qualified_test_filename, writer)
 
         return test_filename
 
@@ -1382,16 +2162,14 @@ class ReportSummaryWriter:
 
         writer.add_heading(HEADING_PRODUCT_METADATA, depth=0)
 
-        writer.add_line(f"**Product ID:** {test_results.product_id}\n\n")
-        writer.add_line(f"**Dataset Release:** {test_results.dataset_release}\n\n")
-        writer.add_line(f"**Plan ID:** {test_results.plan_id}\n\n")
-        writer.add_line(f"**PPO ID:** {test_results.ppo_id}\n\n")
-        writer.add_line(f"**Pipeline Definition ID:** {test_results.pipeline_definition_id}\n\n")
-        writer.add_line(f"**Source Pipeline:** {test_results.source_pipeline}\n\n")
-
-        t = test_results.creation_date
-        month_name = t.strftime("%b")
-        writer.add_line(f"**Creation Date and Time:** {t.day} {month_name}, {t.year} at {t.time()}\n\n")
+        # Build up the full block of metadata and add it to the writer at once
+        writer.add_line(f"**Product ID:** {test_results.product_id}\n\n"
+                        f"**Dataset Release:** {test_results.dataset_release}\n\n"
+                        f"**Plan ID:** {test_results.plan_id}\n\n"
+                        f"**PPO ID:** {test_results.ppo_id}\n\n"
+                        f"**Pipeline Definition ID:** {test_results.pipeline_definition_id}\n\n"
+                        f"**Source Pipeline:** {test_results.source_pipeline}\n\n"
+                        f"**Creation Date and Time:** {test_results.formatted_creation_date}\n\n")
 
     @staticmethod
     @log_entry_exit(logger)
@@ -1406,18 +2184,13 @@ class ReportSummaryWriter:
 
         writer.add_heading(HEADING_TEST_METADATA, depth=0)
 
-        if test_results.exp_product_id is not None:
-            writer.add_line(f"**Exposure Product ID:** {test_results.exp_product_id}\n\n")
-        if test_results.obs_id is not None:
-            writer.add_line(f"**Observation ID:** {test_results.obs_id}\n\n")
-        if test_results.pnt_id is not None:
-            writer.add_line(f"**Pointing ID:** {test_results.pnt_id}\n\n")
-        if test_results.n_exp is not None:
-            writer.add_line(f"**Number of Exposures:** {test_results.n_exp}\n\n")
-        if test_results.tile_id is not None:
-            writer.add_line(f"**Tile ID:** {test_results.tile_id}\n\n")
-        if test_results.obs_mode is not None:
-            writer.add_line(f"**Observation Mode:** {test_results.obs_mode}\n\n")
+        # Build up the block of metadata from the fields which are present, and add it to the writer at once
+        l_meta_lines = [f"**{label}:** {value}\n\n"
+                        for label, value in zip(L_TEST_METADATA_LABELS, _get_test_metadata_values(test_results))
+                        if value is not None]
+
+        if l_meta_lines:
+            writer.add_line("".join(l_meta_lines))
 
     @log_entry_exit(logger)
     def _add_test_case_table(self, writer, test_results, l_test_case_meta):
@@ -1434,19 +2207,13 @@ class ReportSummaryWriter:
 
         num_passed, num_failed = self._calc_num_passed_failed(l_test_case_meta)
 
-        writer.add_line(f"Number of Test Cases passed: {num_passed}\n\n")
-        writer.add_line(f"Number of Test Cases failed: {num_failed}\n\n")
-
-        writer.add_line("| **Test Case** | **Result** |\n")
-        writer.add_line("| :------------ | :--------- |\n")
-
-        for (test_case_meta, test_case_results) in zip(l_test_case_meta,
-                                                       test_results.l_test_results):
-            test_case_name = test_case_meta.name
-
-            # Change suffix of filename from .md to .html and remove the beginning "TR/", since this will be linked from
-            # a file already in that folder
-            html_filename = f"{test_case_meta.filename[3:-3]}.html"
+        writer.add_line(f"Number of Test Cases passed: {num_passed}\n\n"
+                        f"Number of Test Cases failed: {num_failed}\n\n"
+                        f"{TEST_CASE_TABLE_HEADER}")
 
-            test_line = f"| [{test_case_name}]({html_filename}) | {test_case_results.global_result} |\n"
-            writer.add_line(test_line)
+        # Add a line for each test case, and add them to the writer all at once. The link is to the HTML version of
+        # each report, relative to the folder they're in, since this will be linked from a file already in that folder
+        writer.add_line("".join([f"| [{test_case_meta.name}]({test_case_meta.relative_html_filename}) "
+                                 f"| {test_case_results.global_result} |\n"
+                                 for test_case_meta, test_case_results in zip(l_test_case_meta,
+                                                                              test_results.l_test_results)]))
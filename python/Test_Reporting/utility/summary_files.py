@@ -24,7 +24,8 @@ import logging
 import os
 from typing import TYPE_CHECKING
 
-from Test_Reporting.utility.constants import HEADING_TOC, PUBLIC_DIR, README_FILENAME, SUMMARY_FILENAME
+from Test_Reporting.utility.constants import (HEADING_TOC, PUBLIC_DIR, README_FILENAME, SUMMARY_FILENAME,
+                                              WRITE_BUFFER_SIZE, )
 from Test_Reporting.utility.misc import log_entry_exit
 
 if TYPE_CHECKING:
@@ -56,28 +57,31 @@ def build_test_report_summary(test_report_summary_filename,
 
     qualified_test_report_summary_filename = os.path.join(rootdir, PUBLIC_DIR, test_report_summary_filename)
 
-    # Open the file we want to write
-    with open(qualified_test_report_summary_filename, 'w') as fo:
+    # Build up the full text of the file first, so that it can be written out in a single call
 
-        # First, add all the boilerplate lines to the top
-        fo.write("# Testing Reports\n\n")
-        fo.write("This section contains automatically-generated reports on the validation test results products "
-                 "contained in the \"data\" directory of this project. The reports can be found linked in the "
-                 "following table:\n\n")
-        fo.write("| **Test ID** | **Num Passed** | **Num Failed** |\n")
-        fo.write("|:------------|:---------------|:---------------|\n")
+    # First, add all the boilerplate lines to the top
+    l_lines = ["# Testing Reports\n\n",
+               "This section contains automatically-generated reports on the validation test results products "
+               "contained in the \"data\" directory of this project. The reports can be found linked in the "
+               "following table:\n\n",
+               "| **Test ID** | **Num Passed** | **Num Failed** |\n",
+               "|:------------|:---------------|:---------------|\n"]
 
-        # Now, add a line for each test
-        for test_meta in l_test_meta:
+    # Now, add a line for each test
+    for test_meta in l_test_meta:
 
-            _check_md_filename(test_meta.filename)
-            test_html_filename = f"{test_meta.filename[:-3]}.html"
+        _check_md_filename(test_meta.filename)
+        test_html_filename = f"{test_meta.filename[:-3]}.html"
 
-            fo.write(f"| [{test_meta.name}]({test_html_filename}) "
-                     f"| {test_meta.num_passed} "
-                     f"| {test_meta.num_failed} |\n")
+        l_lines.append(f"| [{test_meta.name}]({test_html_filename}) "
+                       f"| {test_meta.num_passed} "
+                       f"| {test_meta.num_failed} |\n")
 
-        fo.write("\nThe log file for building these test reports can be found [here](build.log).")
+    l_lines.append("\nThe log file for building these test reports can be found [here](build.log).")
+
+    # Open the file we want to write, and write it all out at once
+    with open(qualified_test_report_summary_filename, 'w', buffering=WRITE_BUFFER_SIZE) as fo:
+        fo.write("".join(l_lines))
 
 
 @log_entry_exit(logger)
@@ -98,23 +102,26 @@ def update_summary(test_report_summary_filename,
 
     logger.info("Updating GitBooks SUMMARY.md file: %s", qualified_summary_filename)
 
-    # Open the summary file to append to it
-    with open(qualified_summary_filename, 'a') as fo:
+    # Build up the lines to append first, so that they can be written out in a single call
 
-        # Add a line for the summary page
-        fo.write(f"* [Test Reports]({test_report_summary_filename})\n")
+    # Add a line for the summary page
+    l_lines = [f"* [Test Reports]({test_report_summary_filename})\n"]
 
-        # Add a line for each test
-        for test_meta in l_test_meta:
+    # Add a line for each test
+    for test_meta in l_test_meta:
 
-            fo.write(f"  * [{test_meta.name}]({test_meta.filename})\n")
+        l_lines.append(f"  * [{test_meta.name}]({test_meta.filename})\n")
 
-            # Add a line for each test case, grouped after the associated test
-            for test_case_name, test_case_md_filename, passed in test_meta.l_test_case_meta:
+        # Add a line for each test case, grouped after the associated test
+        for test_case_name, test_case_md_filename, passed in test_meta.l_test_case_meta:
 
-                _check_md_filename(test_case_md_filename)
+            _check_md_filename(test_case_md_filename)
 
-                fo.write(f"    * [{test_case_name}]({test_case_md_filename})\n")
+            l_lines.append(f"    * [{test_case_name}]({test_case_md_filename})\n")
+
+    # Open the summary file to append to it
+    with open(qualified_summary_filename, 'a', buffering=WRITE_BUFFER_SIZE) as fo:
+        fo.write("".join(l_lines))
 
 
 @log_entry_exit(logger)
@@ -136,20 +143,13 @@ def update_readme(rootdir):
     with open(qualified_summary_filename) as fi:
         l_summary_lines = fi.readlines()
 
-    # Open the readme file to append to it a table of contents with all lines from the summary file
-
-    with open(qualified_readme_filename, 'a') as fo:
-
-        fo.write(f"\n{HEADING_TOC}\n\n")
-
-        for line in l_summary_lines:
-
-            # Skip the heading line and empty lines
-            if line.startswith("#") or line == "\n":
-                continue
+    # Build up a table of contents with all lines from the summary file, skipping the heading line and empty lines
+    l_toc_lines = [f"\n{HEADING_TOC}\n\n"]
+    l_toc_lines += [line for line in l_summary_lines if not (line.startswith("#") or line == "\n")]
 
-            # Copy all other lines
-            fo.write(line)
+    # Open the readme file to append the table of contents to it
+    with open(qualified_readme_filename, 'a', buffering=WRITE_BUFFER_SIZE) as fo:
+        fo.write("".join(l_toc_lines))
 
 
 def _check_md_filename(filename):
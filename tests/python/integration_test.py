@@ -20,12 +20,15 @@ Unit tests of running the whole script in a minimal state.
 # You should have received a copy of the GNU Lesser General Public License along with this library; if not, write to
 # the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
 
+import json
 import os
 import shutil
 
 from Test_Reporting.specializations.cti_gal import CtiGalReportSummaryWriter
+from Test_Reporting.specializations.dataproc import DataProcReportSummaryWriter
 
-from Test_Reporting.testing.common import TEST_JSON_FILENAME, TEST_TARBALL_FILENAME, TEST_XML_FILENAME
+from Test_Reporting.testing.common import (TEST_DP_RESULTS_FILENAME, TEST_JSON_FILENAME, TEST_TARBALL_FILENAME,
+                                           TEST_XML_FILENAME, )
 
 from Test_Reporting.specialization_keys import CTI_GAL_KEY
 
@@ -61,6 +64,42 @@ def test_build_all_integration(project_copy, test_manifest):
     assert os.path.isfile(qualified_test_report_summary_filename)
 
 
+def test_build_all_integration_multiple(project_copy):
+    """Tests a slimmed-down full execution of the build script, with a manifest containing multiple files which use
+    different build callables, checking that the output is in the order of the manifest.
+
+    Parameters
+    ----------
+    project_copy : str
+    """
+
+    d_manifest = {"test": TEST_TARBALL_FILENAME,
+                  "dataproc": TEST_DP_RESULTS_FILENAME,
+                  CTI_GAL_KEY: {"obs": TEST_TARBALL_FILENAME, "exp": None}}
+    qualified_manifest_filename = os.path.join(project_copy, DATA_DIR, "multiple_manifest.json")
+    with open(qualified_manifest_filename, "w") as fo:
+        json.dump(d_manifest, fo)
+
+    # Set up the mock arguments
+    parser = build_all_report_pages.get_build_argument_parser()
+    args = parser.parse_args([])
+    args.rootdir = project_copy
+    args.manifest = qualified_manifest_filename
+
+    # Call the main workhorse function
+    build_all_report_pages.run_build_all_from_args(args)
+
+    # Check that the summary lists each test, in the order of the manifest
+    qualified_test_report_summary_filename = os.path.join(project_copy, PUBLIC_DIR, TEST_REPORT_SUMMARY_FILENAME)
+    with open(qualified_test_report_summary_filename, "r") as fi:
+        l_test_lines = [line for line in fi if line.startswith("| [")]
+
+    assert len(l_test_lines) == 3
+    assert l_test_lines[0].startswith("| [TR-21950be4-0f90-4d36-be01-2a9a507b36cc]")
+    assert l_test_lines[1].startswith(f"| [{DataProcReportSummaryWriter.test_name}]")
+    assert l_test_lines[2].startswith(f"| [{CtiGalReportSummaryWriter.test_name}")
+
+
 def test_cti_gal_integration(project_copy, cti_gal_manifest):
     """Tests a slimmed-down full execution of the build script, using the CTI-Gal specialization.
 
@@ -20,22 +20,29 @@ Unit tests of writing test reports.
 # You should have received a copy of the GNU Lesser General Public License along with this library; if not, write to
 # the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
 
+import logging
 import os
 import re
+import shutil
+import tarfile
 from typing import List, Set, TYPE_CHECKING
 
 import pytest
+from astropy.table import Table
 
-from Test_Reporting.testing.common import TEST_TARBALL_FILENAME
-from Test_Reporting.utility.constants import PUBLIC_DIR, TEST_REPORTS_SUBDIR
+from Test_Reporting.testing.common import TEST_DP_RESULTS_FILENAME, TEST_TARBALL_FILENAME
+from Test_Reporting.utility.constants import DATA_DIR, PUBLIC_DIR, TEST_DATA_DIR, TEST_REPORTS_SUBDIR
 from Test_Reporting.utility.misc import TocMarkdownWriter
+from Test_Reporting.utility import report_writing
+from Test_Reporting.utility.product_parsing import parse_xml_product
 from Test_Reporting.utility.report_writing import (DIRECTORY_FILE_EXT, DIRECTORY_FILE_FIGURES_HEADER,
                                                    DIRECTORY_FILE_SEPARATOR, DIRECTORY_FILE_TEXTFILES_HEADER,
                                                    HEADING_DETAILED_RESULTS,
                                                    HEADING_GENERAL_INFO, HEADING_PRODUCT_METADATA,
                                                    HEADING_TEST_CASES, HEADING_TEST_METADATA, HEADING_TEXTFILES,
-                                                   MSG_NA, ValTestCaseMeta,
-                                                   ReportSummaryWriter, )
+                                                   MSG_NA, FileInfo, ValTestCaseMeta,
+                                                   ReportSummaryWriter, _link_tree, get_unique_test_case_names,
+                                                   parse_xml_product_cached, )
 
 if TYPE_CHECKING:
     from py.path import local  # noqa F401
@@ -64,6 +71,7 @@ TEST_TITLE = "Test Title"
 TEST_NAME = "Test Name"
 TEST_CASE_NAME = "Test Case Name"
 TEST_CASE_FILENAME = "mock_filename.md"
+TEST_PRODUCT_FILENAME = "she_observation_cti_gal_validation_test_results_product.xml"
 
 
 def _touch_file(qualified_filename: str) -> None:
@@ -155,6 +163,335 @@ def test_write_summary(project_copy):
         assert l_lines[-2] == f"{MSG_NA}\n"
 
 
+def test_write_summary_without_ana_files(project_copy):
+    """Unit test of the `ReportSummaryWriter` class's __call__ method when no figures or textfiles are to be reported,
+    in which case products are read directly from the tarball.
+
+    Parameters
+    ----------
+    project_copy : str
+        Fixture which provides the root directory of a copy of the project
+    """
+
+    writer = ReportSummaryWriter(has_figures=False, has_textfiles=False)
+    test_meta = writer(TEST_TARBALL_FILENAME, project_copy)[0]
+
+    assert test_meta.name == "TR-21950be4-0f90-4d36-be01-2a9a507b36cc"
+    assert os.path.isfile(os.path.join(project_copy, PUBLIC_DIR, test_meta.filename))
+    assert len(test_meta.l_test_case_meta) == EX_N_TEST_CASES
+
+    for test_case_meta in test_meta.l_test_case_meta:
+        qualified_test_case_filename = os.path.join(project_copy, PUBLIC_DIR, test_case_meta.filename)
+        assert os.path.isfile(qualified_test_case_filename)
+
+        # Check that neither a figures nor textfiles section was written
+        with open(qualified_test_case_filename, "r") as fi:
+            text = fi.read()
+        assert "## Figures" not in text
+        assert f"## {HEADING_TEXTFILES}" not in text
+
+    # Check that no tmpdirs were left behind
+    assert not any(fn.startswith("tmp_") for fn in os.listdir(project_copy))
+
+
+def test_write_summary_product_first(project_copy):
+    """Unit test that the same reports are written from a results tarball whether its product is stored before or
+    after the data files it references.
+
+    Parameters
+    ----------
+    project_copy : str
+        Fixture which provides the root directory of a copy of the project
+    """
+
+    # The test tarball stores its data files first. Repack it with its product moved to the front
+    qualified_tarball_filename = os.path.join(project_copy, DATA_DIR, TEST_TARBALL_FILENAME)
+    reordered_tarball_filename = f"reordered_{TEST_TARBALL_FILENAME}"
+    with tarfile.open(qualified_tarball_filename, "r:gz") as tf_in:
+        l_members = sorted(tf_in.getmembers(), key=lambda member: not member.name.endswith(".xml"))
+        with tarfile.open(os.path.join(project_copy, DATA_DIR, reordered_tarball_filename), "w:gz") as tf_out:
+            for member in l_members:
+                tf_out.addfile(member, tf_in.extractfile(member) if member.isfile() else None)
+
+    def read_reports(test_meta):
+        d_text = {}
+        for filename in (test_meta.filename, *(meta.filename for meta in test_meta.l_test_case_meta)):
+            with open(os.path.join(project_copy, PUBLIC_DIR, filename), "r") as fi:
+                d_text[filename] = fi.read()
+        return d_text
+
+    d_ex_text = read_reports(ReportSummaryWriter()(TEST_TARBALL_FILENAME, project_copy)[0])
+    d_text = read_reports(ReportSummaryWriter()(reordered_tarball_filename, project_copy)[0])
+
+    assert d_text == d_ex_text
+    assert any("![" in text for text in d_text.values())
+
+
+def test_write_summary_after_reportdir_removed(project_copy):
+    """Unit test that a `ReportSummaryWriter` can be called again after the report directory it wrote to has been
+    removed.
+
+    Parameters
+    ----------
+    project_copy : str
+        Fixture which provides the root directory of a copy of the project
+    """
+
+    writer = ReportSummaryWriter()
+    writer(TEST_TARBALL_FILENAME, project_copy)
+
+    shutil.rmtree(os.path.join(project_copy, PUBLIC_DIR))
+
+    test_meta = writer(TEST_TARBALL_FILENAME, project_copy)[0]
+    assert os.path.isfile(os.path.join(project_copy, PUBLIC_DIR, test_meta.filename))
+
+
+def test_read_results_tarball_passes(project_copy, tmpdir, monkeypatch):
+    """Unit test that a results tarball is read in a single pass if its product is stored before the data files it
+    references, and in one more pass if not.
+
+    Parameters
+    ----------
+    project_copy : str
+        Fixture which provides the root directory of a copy of the project
+    tmpdir : local
+        pytest's `tmpdir` fixture
+    monkeypatch : MonkeyPatch
+        pytest's `monkeypatch` fixture
+    """
+
+    # The test tarball stores its data files first. Repack it with its product moved to the front
+    qualified_tarball_filename = os.path.join(project_copy, DATA_DIR, TEST_TARBALL_FILENAME)
+    qualified_reordered_tarball_filename = os.path.join(tmpdir, f"reordered_{TEST_TARBALL_FILENAME}")
+    with tarfile.open(qualified_tarball_filename, "r:gz") as tf_in:
+        l_members = sorted(tf_in.getmembers(), key=lambda member: not member.name.endswith(".xml"))
+        with tarfile.open(qualified_reordered_tarball_filename, "w:gz") as tf_out:
+            for member in l_members:
+                tf_out.addfile(member, tf_in.extractfile(member) if member.isfile() else None)
+
+    l_opened_filenames: List[str] = []
+    tarfile_open = tarfile.open
+
+    def mock_tarfile_open(name, *args, **kwargs):
+        l_opened_filenames.append(name)
+        return tarfile_open(name, *args, **kwargs)
+
+    monkeypatch.setattr(report_writing.tarfile, "open", mock_tarfile_open)
+
+    writer = ReportSummaryWriter()
+    l_test_results = writer._read_results_tarball(qualified_reordered_tarball_filename,
+                                                  os.path.join(tmpdir, "product_first"))
+    assert l_opened_filenames == [qualified_reordered_tarball_filename]
+
+    # Check that the referenced data files present in the tarball were all extracted in that pass
+    s_data_filenames = {os.path.normpath(member.name) for member in l_members
+                        if member.isfile() and not member.name.endswith(".xml")}
+    s_ex_extracted_filenames = ReportSummaryWriter._get_referenced_data_filenames(l_test_results) & s_data_filenames
+    assert len(s_ex_extracted_filenames) > 0
+    for data_filename in s_ex_extracted_filenames:
+        assert os.path.isfile(os.path.join(tmpdir, "product_first", data_filename))
+
+    l_opened_filenames.clear()
+    writer._read_results_tarball(qualified_tarball_filename, os.path.join(tmpdir, "data_first"))
+    assert l_opened_filenames == [qualified_tarball_filename, qualified_tarball_filename]
+
+
+def test_write_summary_skip_unchanged(project_copy):
+    """Unit test that test case reports aren't rebuilt when `skip_unchanged` is set and they're up-to-date.
+
+    Parameters
+    ----------
+    project_copy : str
+        Fixture which provides the root directory of a copy of the project
+    """
+
+    writer = ReportSummaryWriter(skip_unchanged=True)
+    test_meta = writer(TEST_TARBALL_FILENAME, project_copy)[0]
+
+    l_qualified_test_case_filenames = [os.path.join(project_copy, PUBLIC_DIR, test_case_meta.filename)
+                                       for test_case_meta in test_meta.l_test_case_meta]
+    l_mtimes = [os.stat(qualified_filename).st_mtime_ns for qualified_filename in l_qualified_test_case_filenames]
+
+    # Run again, and check that the same metadata is returned but the reports weren't rewritten
+    assert writer(TEST_TARBALL_FILENAME, project_copy)[0] == test_meta
+    assert [os.stat(qualified_filename).st_mtime_ns
+            for qualified_filename in l_qualified_test_case_filenames] == l_mtimes
+
+    # Touch the results tarball so it's newer, and check that the reports are now rewritten
+    qualified_tarball_filename = os.path.join(project_copy, DATA_DIR, TEST_TARBALL_FILENAME)
+    os.utime(qualified_tarball_filename, ns=(max(l_mtimes) + 1, max(l_mtimes) + 1))
+    writer(TEST_TARBALL_FILENAME, project_copy)
+    assert all(os.stat(qualified_filename).st_mtime_ns > mtime
+               for qualified_filename, mtime in zip(l_qualified_test_case_filenames, l_mtimes))
+
+
+def test_write_summary_skip_unchanged_without_ana_files(project_copy, caplog):
+    """Unit test that no errors are logged checking if test case reports are up-to-date when `skip_unchanged` is set
+    and no figures or textfiles are to be reported, in which case the analysis files tarballs aren't extracted.
+
+    Parameters
+    ----------
+    project_copy : str
+        Fixture which provides the root directory of a copy of the project
+    caplog : LogCaptureFixture
+        pytest's `caplog` fixture
+    """
+
+    writer = ReportSummaryWriter(has_figures=False, has_textfiles=False, skip_unchanged=True)
+    test_meta = writer(TEST_TARBALL_FILENAME, project_copy)[0]
+
+    caplog.clear()
+    assert writer(TEST_TARBALL_FILENAME, project_copy)[0] == test_meta
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+
+def test_read_results_tarball(project_copy, tmpdir, monkeypatch):
+    """Unit test of the `ReportSummaryWriter._read_results_tarball` method, checking that products are found with the
+    `_find_product_filenames` method, so that child classes can override it, that duplicate copies of a product are
+    only parsed once, and that only referenced datafiles are extracted.
+
+    Parameters
+    ----------
+    project_copy : str
+        Fixture which provides the root directory of a copy of the project
+    tmpdir : local
+        pytest's `tmpdir` fixture
+    monkeypatch : MonkeyPatch
+        pytest's `monkeypatch` fixture
+    """
+
+    # Repack the test tarball with a second copy of its product in a subdir, plus an unreferenced file
+    qualified_tarball_filename = os.path.join(project_copy, DATA_DIR, TEST_TARBALL_FILENAME)
+    qualified_duplicated_tarball_filename = os.path.join(tmpdir, f"duplicated_{TEST_TARBALL_FILENAME}")
+    with tarfile.open(qualified_tarball_filename, "r:gz") as tf_in:
+        with tarfile.open(qualified_duplicated_tarball_filename, "w:gz") as tf_out:
+            for member in tf_in.getmembers():
+                tf_out.addfile(member, tf_in.extractfile(member) if member.isfile() else None)
+                if member.isfile() and member.name.endswith(".xml"):
+                    member.name = f"dir/{os.path.basename(member.name)}"
+                    tf_out.addfile(member, tf_in.extractfile(member))
+            tf_out.add(os.path.join(project_copy, DATA_DIR, TEST_TARBALL_FILENAME), arcname="unreferenced.tar.gz")
+
+    l_parsed_filenames: List[str] = []
+
+    def mock_parse_xml_product(qualified_filename):
+        l_parsed_filenames.append(qualified_filename)
+        return parse_xml_product(qualified_filename)
+
+    monkeypatch.setattr(report_writing, "parse_xml_product", mock_parse_xml_product)
+
+    l_l_found_product_filenames: List[List[str]] = []
+
+    class RecordingWriter(ReportSummaryWriter):
+        def _find_product_filenames(self, qualified_tmpdir):
+            l_product_filenames = super()._find_product_filenames(qualified_tmpdir)
+            l_l_found_product_filenames.append(l_product_filenames)
+            return l_product_filenames
+
+    qualified_tmp_datadir = os.path.join(tmpdir, "data")
+    l_test_results = RecordingWriter()._read_results_tarball(qualified_duplicated_tarball_filename,
+                                                             qualified_tmp_datadir)
+
+    assert len(l_l_found_product_filenames) == 1
+    assert len(l_l_found_product_filenames[0]) == 2
+    assert len(l_parsed_filenames) == 1
+    assert len(l_test_results) == 2
+    assert l_test_results[1] is l_test_results[0]
+
+    # Check that only referenced datafiles were extracted (the test tarball doesn't contain all of them)
+    s_extracted_data_filenames = {os.path.relpath(os.path.join(qualified_dir, filename), qualified_tmp_datadir)
+                                  for qualified_dir, _, l_filenames in os.walk(qualified_tmp_datadir)
+                                  for filename in l_filenames if not filename.endswith(".xml")}
+    assert len(s_extracted_data_filenames) > 0
+    assert s_extracted_data_filenames <= ReportSummaryWriter._get_referenced_data_filenames(l_test_results)
+
+
+@pytest.mark.parametrize("parse_in_processes", [False, True])
+def test_parse_products(rootdir, parse_in_processes):
+    """Unit test of the `ReportSummaryWriter._parse_products` method, checking that multiple products are parsed
+    correctly and in order when done in parallel with both threads and processes, and that a product listed multiple
+    times is only parsed once.
+
+    Parameters
+    ----------
+    rootdir : str
+        Pytest fixture providing the root directory of the project.
+    parse_in_processes : bool
+        Whether to parse the products with a pool of processes rather than threads.
+    """
+
+    qualified_product_filename = os.path.join(rootdir, TEST_DATA_DIR, TEST_PRODUCT_FILENAME)
+    qualified_dp_product_filename = os.path.join(rootdir, TEST_DATA_DIR, TEST_DP_RESULTS_FILENAME)
+    expected_test_results = parse_xml_product(qualified_product_filename)
+    expected_dp_test_results = parse_xml_product(qualified_dp_product_filename)
+
+    writer = ReportSummaryWriter(parse_in_processes=parse_in_processes)
+    l_test_results = writer._parse_products([qualified_product_filename,
+                                             qualified_dp_product_filename,
+                                             qualified_product_filename])
+
+    assert l_test_results == [expected_test_results, expected_dp_test_results, expected_test_results]
+    assert l_test_results[2] is l_test_results[0]
+
+
+def test_parse_xml_product_cached(rootdir, tmpdir):
+    """Unit test of the `parse_xml_product_cached` function, checking that a product is only re-parsed if it changes.
+
+    Parameters
+    ----------
+    rootdir : str
+        Pytest fixture providing the root directory of the project.
+    tmpdir : local
+        pytest's `tmpdir` fixture
+    """
+
+    # Work with a copy of the product, so we can safely modify it
+    qualified_product_filename = os.path.join(tmpdir, TEST_PRODUCT_FILENAME)
+    shutil.copy(os.path.join(rootdir, TEST_DATA_DIR, TEST_PRODUCT_FILENAME), qualified_product_filename)
+
+    def parse_with_stat():
+        product_stat = os.stat(qualified_product_filename)
+        return parse_xml_product_cached(qualified_product_filename, product_stat.st_mtime_ns, product_stat.st_size)
+
+    test_results = parse_with_stat()
+    assert test_results == parse_xml_product(qualified_product_filename)
+    assert parse_with_stat() is test_results
+
+    # Update the modification time of the file, and check that it's now parsed again
+    product_mtime_ns = os.stat(qualified_product_filename).st_mtime_ns
+    os.utime(qualified_product_filename, ns=(product_mtime_ns + 1, product_mtime_ns + 1))
+    new_test_results = parse_with_stat()
+    assert new_test_results is not test_results
+    assert new_test_results == test_results
+
+
+def test_get_referenced_data_filenames(cti_gal_test_results):
+    """ Unit test of the `ReportSummaryWriter._get_referenced_data_filenames` method.
+
+    Parameters
+    ----------
+    cti_gal_test_results : TestResults
+        Pytest fixture providing a mock `TestResults` object.
+    """
+
+    s_expected_filenames: Set[str] = set()
+    for test_case_results in cti_gal_test_results.l_test_results:
+        ana_result = test_case_results.analysis_result
+        s_expected_filenames.update(filename for filename in (ana_result.figures_tarball, ana_result.textfiles_tarball)
+                                    if filename is not None)
+
+    assert len(s_expected_filenames) > 0
+    assert ReportSummaryWriter._get_referenced_data_filenames([cti_gal_test_results]) == s_expected_filenames
+
+    # Check that references to files outside the tarball are excluded
+    ana_result = cti_gal_test_results.l_test_results[0].analysis_result
+    ana_result.figures_tarball = "data/../../outside.tar.gz"
+    ana_result.textfiles_tarball = "/outside.tar.gz"
+    s_data_filenames = ReportSummaryWriter._get_referenced_data_filenames([cti_gal_test_results])
+    assert "../outside.tar.gz" not in s_data_filenames
+    assert "/outside.tar.gz" not in s_data_filenames
+
+
 def test_add_test_case_meta(cti_gal_test_results):
     """ Unit test of the `ReportSummaryWriter._add_test_case_meta` method.
 
@@ -172,7 +509,9 @@ def test_add_test_case_meta(cti_gal_test_results):
     # Check that a sample of the writer's lines are as expected
     assert writer._l_toc_lines[0] == (f"1. [{HEADING_GENERAL_INFO}](#"
                                       f"{HEADING_GENERAL_INFO.lower().replace(' ', '-')}-0)\n")
-    assert writer._l_lines[-1] == "**Result:** PASSED\n\n"
+    assert writer._l_lines[-1] == (f"**Test Case ID:** {test_case_results.test_id}\n\n"
+                                   f"**Description:** {test_case_results.test_description}\n\n"
+                                   "**Result:** PASSED\n\n")
 
 
 def test_add_test_case_details(cti_gal_test_results):
@@ -192,7 +531,164 @@ def test_add_test_case_details(cti_gal_test_results):
     # Check that a sample of the writer's lines are as expected
     assert writer._l_toc_lines[0] == (f"1. [{HEADING_DETAILED_RESULTS}](#"
                                       f"{HEADING_DETAILED_RESULTS.lower().replace(' ', '-')}-0)\n")
-    assert writer._l_lines[-1] == "\n```\n\n"
+    last_supp_info = test_case_results.l_requirements[-1].l_supp_info[-1]
+    assert writer._l_lines[-1] == (f"{last_supp_info.info_description}\n\n"
+                                   "```\n"
+                                   f"{last_supp_info.info_value.strip()}\n"
+                                   "```\n\n")
+
+
+def test_add_table_contents_md():
+    """ Unit test of the `ReportSummaryWriter._add_table_contents_md` method.
+    """
+
+    writer = TocMarkdownWriter(TEST_TITLE)
+    table = Table({"foo": [1, 2], "bar": ["a\nb", "c"]})
+    ReportSummaryWriter(test_name=TEST_NAME)._add_table_contents_md(writer, table)
+
+    assert writer._l_lines[-1] == ("| **foo** | **bar** |\n"
+                                   "|:--|:--|\n"
+                                   "| 1 | ab |\n"
+                                   "| 2 | c |\n"
+                                   "\n")
+
+
+def test_add_test_case_textfiles(tmpdir):
+    """ Unit test of the `ReportSummaryWriter._add_test_case_textfiles` method, checking that a table is identified
+    from the contents of a file even if its extension doesn't indicate its format.
+
+    Parameters
+    ----------
+    tmpdir : local
+        pytest's `tmpdir` fixture
+    """
+
+    Table({"foo": [1, 2]}).write(os.path.join(tmpdir, "table.dat"), format="fits")
+    with open(os.path.join(tmpdir, "text.dat"), "w") as fo:
+        fo.write("foobar\n")
+
+    writer = TocMarkdownWriter(TEST_TITLE)
+    ReportSummaryWriter(test_name=TEST_NAME)._add_test_case_textfiles(
+        writer=writer,
+        ana_files_tmpdir=str(tmpdir),
+        l_ana_files_labels_and_filenames=[FileInfo(label="table", filename="table.dat", is_figure=False),
+                                          FileInfo(label="text", filename="text.dat", is_figure=False)])
+
+    assert writer._l_lines[-3].startswith("<div class=\"tableContainer\">")
+    assert "<td>2</td>" in writer._l_lines[-3]
+    assert writer._l_lines[-1] == "```\nfoobar\n```\n\n"
+
+
+def test_calc_num_passed_failed():
+    """ Unit test of the `ReportSummaryWriter._calc_num_passed_failed` method.
+    """
+
+    l_test_case_meta = [ValTestCaseMeta(name="A", filename="A.md", passed=True),
+                        ValTestCaseMeta(name="B", filename="B.md", passed=False),
+                        ValTestCaseMeta(name="C", filename="C.md", passed=True),
+                        ValTestCaseMeta(name="D", filename="D.md")]
+
+    assert ReportSummaryWriter._calc_num_passed_failed(l_test_case_meta) == (2, 2)
+
+
+def test_get_unique_test_case_names():
+    """ Unit test of the `get_unique_test_case_names` function.
+    """
+
+    assert get_unique_test_case_names(("A", "B", "A", "A"), "-tail") == ("A-tail", "B-tail", "A-2-tail", "A-3-tail")
+    assert get_unique_test_case_names((), "-tail") == ()
+
+
+def test_queue_write(tmpdir, monkeypatch):
+    """Unit test of the `ReportSummaryWriter._queue_write` method, checking that writes are held until flushed, unless
+    the total size of queued-up text grows too large.
+
+    Parameters
+    ----------
+    tmpdir : local
+        pytest's `tmpdir` fixture
+    monkeypatch : MonkeyPatch
+        pytest's `monkeypatch` fixture
+    """
+
+    writer = ReportSummaryWriter(test_name=TEST_NAME)
+
+    md_writer = TocMarkdownWriter(TEST_TITLE)
+    text_len = len(md_writer.get_text())
+    monkeypatch.setattr(report_writing, "MAX_PENDING_WRITE_SIZE", 2 * text_len)
+
+    l_qualified_filenames = [os.path.join(tmpdir, "subdir", f"report_{i}.md") for i in range(4)]
+
+    # The first two files fit within the limit, so shouldn't be written until flushed
+    for qualified_filename in l_qualified_filenames[:2]:
+        writer._queue_write(qualified_filename, md_writer)
+    assert not any(os.path.exists(qualified_filename) for qualified_filename in l_qualified_filenames)
+
+    # The third goes over the limit, so all queued files should be written out
+    writer._queue_write(l_qualified_filenames[2], md_writer)
+    assert all(os.path.isfile(qualified_filename) for qualified_filename in l_qualified_filenames[:3])
+
+    # And the queue should be empty again afterwards
+    writer._queue_write(l_qualified_filenames[3], md_writer)
+    assert not os.path.exists(l_qualified_filenames[3])
+    writer._flush_pending_writes()
+    with open(l_qualified_filenames[3], "r") as fi:
+        assert fi.read() == md_writer.get_text()
+
+
+def test_get_data_filename(tmpdir):
+    """Unit test of the `ReportSummaryWriter._get_data_filename` method, checking that results are remembered.
+
+    Parameters
+    ----------
+    tmpdir : local
+        pytest's `tmpdir` fixture
+    """
+
+    writer = ReportSummaryWriter(test_name=TEST_NAME)
+
+    qualified_filename = os.path.join(tmpdir, "data/foo.tar.gz")
+    _touch_file(qualified_filename)
+
+    assert writer._get_data_filename("data/foo.tar.gz", str(tmpdir)) == qualified_filename
+    assert writer._get_data_filename("data/bar.tar.gz", str(tmpdir)) is None
+
+    # Check that the previous results are returned without checking the filesystem again
+    os.remove(qualified_filename)
+    _touch_file(os.path.join(tmpdir, "data/bar.tar.gz"))
+    assert writer._get_data_filename("data/foo.tar.gz", str(tmpdir)) == qualified_filename
+    assert writer._get_data_filename("data/bar.tar.gz", str(tmpdir)) is None
+
+
+def test_link_tree(tmpdir):
+    """Unit test of the `_link_tree` function.
+
+    Parameters
+    ----------
+    tmpdir : local
+        pytest's `tmpdir` fixture
+    """
+
+    qualified_src_dir = os.path.join(tmpdir, "src")
+    qualified_dest_dir = os.path.join(tmpdir, "dest")
+
+    for filename in ("foo.txt", "bar.png", "dir/subfoo.txt"):
+        qualified_filename = os.path.join(qualified_src_dir, filename)
+        os.makedirs(os.path.dirname(qualified_filename), exist_ok=True)
+        with open(qualified_filename, "w") as fo:
+            fo.write(filename)
+
+    # Put a file already at the destination, which should be replaced
+    os.makedirs(qualified_dest_dir)
+    with open(os.path.join(qualified_dest_dir, "foo.txt"), "w") as fo:
+        fo.write("old")
+
+    l_top_level_filenames = _link_tree(qualified_src_dir, qualified_dest_dir)
+
+    assert sorted(l_top_level_filenames) == ["bar.png", "foo.txt"]
+    for filename in ("foo.txt", "bar.png", "dir/subfoo.txt"):
+        with open(os.path.join(qualified_dest_dir, filename), "r") as fi:
+            assert fi.read() == filename
 
 
 @pytest.fixture
@@ -242,6 +738,17 @@ def test_find_directory_filename(mock_unpacked_dir):
     with pytest.raises(ValueError):
         ReportSummaryWriter.find_directory_filename(mock_unpacked_dir)
 
+    # Check that when a list of filenames is provided, it's searched instead of the directory, and that duplicates
+    # within it aren't counted as separate candidates
+    l_filenames = ["foo.bar", EX_DIRECTORY_FILENAME, EX_DIRECTORY_FILENAME]
+    assert (ReportSummaryWriter.find_directory_filename(mock_unpacked_dir, l_filenames) ==
+            qualified_directory_filename)
+    with pytest.raises(FileNotFoundError):
+        ReportSummaryWriter.find_directory_filename(mock_unpacked_dir, ["foo.bar"])
+    with pytest.raises(ValueError):
+        ReportSummaryWriter.find_directory_filename(mock_unpacked_dir, [EX_DIRECTORY_FILENAME,
+                                                                        EX_EXTRA_DIRECTORY_FILENAME])
+
 
 def test_find_product_filenames(mock_unpacked_dir):
     """Unit test of the `ReportSummaryWriter._find_product_filenames` method.
@@ -335,7 +842,13 @@ def test_write_product_metadata(cti_gal_test_results):
     # Check that a sample of the writer's lines are as expected
     assert writer._l_toc_lines[0] == (f"1. [{HEADING_PRODUCT_METADATA}](#"
                                       f"{HEADING_PRODUCT_METADATA.lower().replace(' ', '-')}-0)\n")
-    assert writer._l_lines[-1] == "**Creation Date and Time:** 3 Dec, 2021 at 11:24:43.408000\n\n"
+    assert writer._l_lines[-1] == ("**Product ID:** 21950be4-0f90-4d36-be01-2a9a507b36cc\n\n"
+                                   "**Dataset Release:** NA\n\n"
+                                   "**Plan ID:** e8150578-bc73-4b93-8cd1-e63b90fbbfc7\n\n"
+                                   "**PPO ID:** f50e5402-42fa-4ee0-af66-d8e140065aba\n\n"
+                                   "**Pipeline Definition ID:** PipelineDefinitionId\n\n"
+                                   "**Source Pipeline:** sheAnalysis\n\n"
+                                   "**Creation Date and Time:** 3 Dec, 2021 at 11:24:43.408000\n\n")
 
 
 def test_write_test_metadata(cti_gal_test_results):
@@ -354,7 +867,8 @@ def test_write_test_metadata(cti_gal_test_results):
     # Check that a sample of the writer's lines are as expected
     assert writer._l_toc_lines[0] == (f"1. [{HEADING_TEST_METADATA}](#"
                                       f"{HEADING_TEST_METADATA.lower().replace(' ', '-')}-0)\n")
-    assert writer._l_lines[-1] == "**Number of Exposures:** 4\n\n"
+    assert writer._l_lines[-1] == ("**Observation ID:** 25463\n\n"
+                                   "**Number of Exposures:** 4\n\n")
 
 
 def test_write_test_case_table(cti_gal_test_results):
@@ -20,13 +20,15 @@ Unit tests of misc. utility functions.
 # You should have received a copy of the GNU Lesser General Public License along with this library; if not, write to
 # the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
 
+import logging
 import os
 
 import pytest
 
 from Test_Reporting.testing.common import TEST_TARBALL_FILENAME, TEST_XML_FILENAME
-from Test_Reporting.utility.constants import TEST_DATA_DIR
-from Test_Reporting.utility.misc import ensure_data_prefix, extract_tarball, get_qualified_path, hash_any
+from Test_Reporting.utility.constants import HEADING_TOC, TEST_DATA_DIR
+from Test_Reporting.utility.misc import (AsyncDirectoryRemover, TocMarkdownWriter, ensure_data_prefix, extract_tarball,
+                                         get_qualified_path, hash_any, log_entry_exit, )
 
 TEST_MAX_LEN = 16
 
@@ -55,6 +57,29 @@ def test_get_qualified_path():
     assert get_qualified_path(test_relative_path, base=test_base) == os.path.join(test_base, test_relative_path)
 
 
+def test_log_entry_exit(caplog):
+    """Unit test of the `log_entry_exit` decorator, checking that it only logs when its level is enabled.
+    """
+
+    test_logger = logging.getLogger("test_log_entry_exit")
+
+    @log_entry_exit(test_logger)
+    def add_one(x):
+        return x + 1
+
+    # Check that nothing is logged when debug logging is disabled, but the function still works
+    with caplog.at_level(logging.INFO, logger=test_logger.name):
+        assert add_one(1) == 2
+    assert len(caplog.records) == 0
+
+    # Check that entry and exit are both logged when debug logging is enabled
+    with caplog.at_level(logging.DEBUG, logger=test_logger.name):
+        assert add_one(2) == 3
+    assert len(caplog.records) == 2
+    assert "Entering method" in caplog.records[0].getMessage()
+    assert "Exiting method" in caplog.records[1].getMessage()
+
+
 def test_extract_tarball(rootdir, tmpdir):
     """Unit test of the `extract_tarball` method.
 
@@ -117,3 +142,61 @@ def test_hash_any():
 
     assert isinstance(hash_str, str)
     assert len(hash_str) <= TEST_MAX_LEN
+
+    # Check that the hash is deterministic and matches the expected value
+    assert hash_any("foo") == "r2k9pBRi7CR1POUUA70e5bUAzWlB9i88l0Vt2P+n+VI="
+    assert hash_str == "r2k9pBRi7CR1POUUA70e5bUAzWlB9i88l0Vt2P+n+VI="[:TEST_MAX_LEN]
+
+
+def test_toc_markdown_writer_get_text():
+    """Unit test of the `TocMarkdownWriter.get_text` method, along with the methods to add lines and headings.
+    """
+
+    writer = TocMarkdownWriter("Title")
+    writer.add_heading("Foo", depth=0)
+    writer.add_line("foo\n\n")
+
+    # With only one heading, no Table of Contents should be included
+    assert writer.get_text() == "# Title\n\n## Foo <a id=\"foo-0\"></a>\n\nfoo\n\n"
+
+    writer.add_heading("Bar", depth=1)
+
+    assert writer.get_text() == ("# Title\n\n"
+                                 f"{HEADING_TOC}\n\n"
+                                 "1. [Foo](#foo-0)\n"
+                                 "  1. [Bar](#bar-1)\n"
+                                 "\n"
+                                 "## Foo <a id=\"foo-0\"></a>\n\n"
+                                 "foo\n\n"
+                                 "### Bar <a id=\"bar-1\"></a>\n\n")
+
+    # Lines added in bulk should be appended in order, as if added individually
+    writer.add_lines(f"{x}\n" for x in ("a", "b"))
+
+    assert writer.get_text().endswith("### Bar <a id=\"bar-1\"></a>\n\na\nb\n")
+
+
+def test_async_directory_remover(tmpdir):
+    """Unit test of the `AsyncDirectoryRemover` class.
+    """
+
+    qualified_trash_dir = os.path.join(tmpdir, "trash")
+    os.makedirs(qualified_trash_dir)
+
+    l_qualified_dirs = [os.path.join(tmpdir, f"dir_{i}") for i in range(3)]
+    for qualified_dir in l_qualified_dirs:
+        os.makedirs(os.path.join(qualified_dir, "subdir"))
+        with open(os.path.join(qualified_dir, "subdir", "file.txt"), "w") as fo:
+            fo.write("foo")
+
+    remover = AsyncDirectoryRemover(qualified_trash_dir)
+    for qualified_dir in l_qualified_dirs:
+        remover.remove(qualified_dir)
+
+        # The directory should be moved out of the way immediately
+        assert not os.path.exists(qualified_dir)
+
+    # After closing, everything including the trash directory should be gone
+    remover.close()
+    assert not os.path.exists(qualified_trash_dir)
+    assert os.listdir(tmpdir) == []